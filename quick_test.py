@@ -6,7 +6,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 try:
-    from src.ai_content_factory.agents.research_agent import AdvancedResearchAgent
+    from ai_content_factory.agents.research_agent import AdvancedResearchAgent
     agent = AdvancedResearchAgent()
     print("✅ Research Agent loaded successfully!")
     print("🎉 You're good to continue!")
@@ -3,6 +3,8 @@ Startup script for the AI Content Factory web interface.
 Run this to launch the FastAPI server and open the web UI.
 """
 
+import os
+import socket
 import subprocess
 import sys
 import time
@@ -29,24 +31,55 @@ def main():
     print("   - Dashboard: http://localhost:8000")
     print("\n⏳ Please wait while the server starts...\n")
 
-    # Open browser after a short delay
+    # Open browser once the server accepts connections (bounded number of probes)
     def open_browser():
-        time.sleep(3)
-        webbrowser.open("http://localhost:8000")
+        for _ in range(100):
+            try:
+                with socket.create_connection(("127.0.0.1", 8000), timeout=0.1):
+                    break
+            except OSError:
+                time.sleep(0.05)
+        webbrowser.open("http://localhost:8000", new=0)
 
     import threading
     browser_thread = threading.Thread(target=open_browser, daemon=True)
     browser_thread.start()
 
+    # Multi-worker deployments go through gunicorn with --preload so the app
+    # (agents, ChromaDB client, models) is imported once in the master and
+    # shared with the workers via copy-on-write fork instead of re-imported
+    # per spawned worker.
+    workers = int(os.environ.get("AICF_WORKERS", "1"))
+
+    # Auto-reload runs a file watcher plus a supervisor process; opt in for dev only
+    reload = os.environ.get("AICF_RELOAD", "0") == "1"
+
     # Start the FastAPI server
     try:
-        subprocess.run([
-            sys.executable, "-m", "uvicorn",
-            "src.ai_content_factory.api.app:app",
-            "--host", "0.0.0.0",
-            "--port", "8000",
-            "--reload"
-        ])
+        if workers > 1 and not sys.platform.startswith("win"):
+            subprocess.run([
+                sys.executable, "-m", "gunicorn",
+                "src.ai_content_factory.api.app:app",
+                "-k", "uvicorn.workers.UvicornWorker",
+                "-w", str(workers),
+                "-b", "0.0.0.0:8000",
+                "--preload"
+            ])
+        else:
+            # Run uvicorn in this interpreter rather than paying for a second
+            # Python cold start via `python -m uvicorn`
+            import uvicorn
+
+            uvicorn.run(
+                "src.ai_content_factory.api.app:app",
+                host="0.0.0.0",
+                port=8000,
+                # uvloop has no Windows build; fall back to the default asyncio loop there
+                loop="asyncio" if sys.platform.startswith("win") else "uvloop",
+                http="httptools",
+                workers=1,
+                reload=reload
+            )
     except KeyboardInterrupt:
         print("\n\n👋 Shutting down server...")
         print("   Thank you for using AI Content Factory!")
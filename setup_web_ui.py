@@ -2,22 +2,40 @@
 Quick setup script to install FastAPI dependencies and verify the installation.
 """
 
+import asyncio
+import json
+import shutil
 import subprocess
 import sys
+import urllib.request
 from pathlib import Path
 
+OLLAMA_TAGS_URL = "http://localhost:11434/api/tags"
+
 
 def check_command(command):
-    """Check if a command is available."""
+    """Check if a command is available on PATH (no child process is started)."""
+    return shutil.which(command) is not None
+
+
+async def probe_ollama_models():
+    """Return model names from the local Ollama API, or None if it is unreachable."""
+    def fetch():
+        with urllib.request.urlopen(OLLAMA_TAGS_URL, timeout=5) as response:
+            return [m.get("name", "") for m in json.load(response).get("models", [])]
+
     try:
-        subprocess.run(
-            [command, "--version"],
-            capture_output=True,
-            check=True
-        )
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+        return await asyncio.to_thread(fetch)
+    except (OSError, ValueError):
+        return None
+
+
+async def run_probes(chroma_dir):
+    """Run the independent pre-flight probes concurrently."""
+    return await asyncio.gather(
+        probe_ollama_models(),
+        asyncio.to_thread(chroma_dir.exists)
+    )
 
 def main():
     print("=" * 60)
@@ -27,9 +45,13 @@ def main():
     # Check Python version
     print("\n✓ Python version:", sys.version.split()[0])
 
-    # Check if uv is available
+    # Run the independent pre-flight probes at once; results are reported below
+    chroma_dir = Path("src/ai_content_factory/data/chroma")
+    ollama_models, has_chroma = asyncio.run(run_probes(chroma_dir))
     has_uv = check_command("uv")
+    has_ollama = check_command("ollama")
 
+    # Check if uv is available
     if has_uv:
         print("✓ uv package manager detected")
         print("\n📦 Installing dependencies with uv...")
@@ -46,7 +68,12 @@ def main():
             subprocess.run([
                 sys.executable, "-m", "pip", "install",
                 "fastapi>=0.115.0",
-                "uvicorn[standard]>=0.32.0"
+                "pydantic>=2.9.0",
+                "pydantic-core>=2.23.0",
+                "uvicorn[standard]>=0.32.0",
+                "httptools>=0.6.0",
+                "orjson>=3.10.0",
+                *([] if sys.platform.startswith("win") else ["uvloop>=0.19.0"])
             ], check=True)
             print("✓ FastAPI and Uvicorn installed!")
         except subprocess.CalledProcessError as e:
@@ -55,28 +82,20 @@ def main():
 
     # Check if Ollama is running
     print("\n🔍 Checking Ollama...")
-    if check_command("ollama"):
+    if has_ollama:
         print("✓ Ollama is installed")
-        try:
-            result = subprocess.run(
-                ["ollama", "list"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            if "qwen2.5:7b" in result.stdout.lower() or "qwen2.5" in result.stdout.lower():
-                print("✓ Model qwen2.5:7b is available")
-            else:
-                print("⚠ Model qwen2.5:7b not found")
-                print("  Run: ollama pull qwen2.5:7b")
-        except subprocess.CalledProcessError:
-            print("⚠ Could not check Ollama models")
+        if ollama_models is None:
+            print("⚠ Could not reach the Ollama API to check models (is `ollama serve` running?)")
+        elif any("qwen2.5" in name.lower() for name in ollama_models):
+            print("✓ Model qwen2.5:7b is available")
+        else:
+            print("⚠ Model qwen2.5:7b not found")
+            print("  Run: ollama pull qwen2.5:7b")
     else:
         print("❌ Ollama not found. Please install from https://ollama.ai")
 
     # Check if brand voice data exists
-    chroma_dir = Path("src/ai_content_factory/data/chroma")
-    if chroma_dir.exists():
+    if has_chroma:
         print("✓ ChromaDB directory exists")
     else:
         print("⚠ ChromaDB directory not found")
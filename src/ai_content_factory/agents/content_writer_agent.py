@@ -3,11 +3,19 @@ LangChain/LangGraph-based Content Writer Agent
 Refactored for multi-agent workflow compatibility using LangGraph state machines.
 """
 
+import asyncio
+import json
+import os
 import re
-from dataclasses import dataclass
+import tempfile
+import threading
+import time
+import zlib
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TypedDict
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 from langgraph.graph import END, StateGraph
 
 from ..config.config_loader import load_config
@@ -26,11 +34,131 @@ WORDS_PER_SECTION = 250
 MIN_SECTIONS = 3
 MAX_SECTIONS = 7
 KEYWORD_FREQUENCY = 200  # 1 keyword per N words (target ~1.5-2% density)
+WORD_LIMIT_SLACK = 1.15  # Stop streaming a part once it reaches 115% of its target words
+TOKENS_PER_TARGET_WORD = 2.2  # num_predict budget per target word (backstop for the word limit)
 DEFAULT_BRAND_VOICE = "Direct, educational, accessible. Example: 'Skin is a complex organ. Your skincare doesn't have to be.'"
+BRAND_VOICE_CACHE_TTL_SECONDS = 3600  # Re-query Chroma hourly so newly ingested examples show up
+BRAND_VOICE_CACHE_MAX_ENTRIES = 512
+BRAND_VOICE_EXAMPLE_MAX_CHARS = 400  # Bounds brand_voice_context so prompt length stays stable
+
+# Meta-commentary patterns stripped from LLM output (compiled once at import)
+META_TEXT_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+    for pattern in (
+        r'^["\'](.+?)["\']$',  # Remove wrapping quotes
+        r'^\s*(Okay,?|Sure,?|Certainly,?)\s+',  # Remove agreement phrases
+        r'^["\']?\s*Here[\'s]+\s+.{0,50}?:\s*["\']?\s*',  # "Here's a/an/the..."
+        r'\n\n---\n\n\*\*Word Count:?\*\*.*$',  # Word count notes
+        r'\*\*\[.*?\]\*\*',  # Markdown link artifacts
+        r'^\s*\[.*?\]\s*',  # [Bracket notes]
+    )
+]
+
+# Phrases marking a first paragraph as meta-commentary (matched on lowercased text)
+META_FIRST_PARA_RE = re.compile(
+    r"here's|here is|okay|let me|i'll|i will|aiming for|word count|as an ai|as a|certainly"
+)
+INTRO_META_FIRST_PARA_RE = re.compile(r"here's|okay|let me|aiming for|for the")
+
+# Leading run of '#' on any line (heading marker)
+HEADING_MARKER_RE = re.compile(r'^#+', re.MULTILINE)
+
+# One comma-separated keyword with surrounding whitespace and quotes excluded
+KEYWORD_RE = re.compile(r'[^,"\'\s](?:[^,]*[^,"\'\s])?')
+
+# Section markdown: leading "## " heading line, then the body
+SECTION_HEADING_RE = re.compile(r'## (?P<heading>[^\n]*)\n(?P<body>.*)', re.DOTALL)
+BLANK_LINES_RE = re.compile(r'\n\s*\n')
+
+# Writing prompts are fixed per content part, so they are built once here
+OUTLINE_SYSTEM_PROMPT = """You are an expert content strategist. Create a clear, logical outline for a blog article.
+
+Requirements:
+- Direct, conversational, simple style
+- Each section should cover one main point
+- Section titles should be descriptive and engaging
+- Logical flow from one section to the next
+
+Respond with ONLY section titles, one per line, no numbering or formatting."""
+WRITER_PREAMBLE = (
+    "You are a professional content writer. OUTPUT MUST BE ONLY the article text requested — "
+    "no explanations, no meta-commentary, no numbered reasoning, and no leading phrases such as "
+    "\"Here's\", \"Okay\", \"Let me\", \"As an AI\", \"I will\". Do not include quotes around the content."
+)
+WRITER_RULES = WRITER_PREAMBLE + (
+    " Do not add labels like \"Introduction:\", \"Section:\", or \"Conclusion:\" unless explicitly asked. "
+    "Follow the exact word count and formatting instructions in the user prompt. "
+    "If you cannot follow the instructions, return exactly the string: [UNABLE_TO_COMPLY]."
+)
+INTRODUCTION_SYSTEM_PROMPT = WRITER_RULES + "\n\n" + (
+    "CRITICAL: Write with very short sentences (8-14 words average). Most sentences must be 10-12 words. "
+    "This is essential for readability. Use simple 6th-7th grade vocabulary only."
+)
+SECTION_SYSTEM_PROMPT = WRITER_RULES + "\n\n" + (
+    "CRITICAL: Write with very short sentences (8-14 words average). Most sentences must be 10-12 words. "
+    "Use simple 6th-7th grade vocabulary only. Short paragraphs (2-3 sentences)."
+)
+CONCLUSION_SYSTEM_PROMPT = WRITER_RULES + "\n\n" + (
+    "CRITICAL: Write with very short sentences (8-14 words average). Most sentences must be 10-12 words. "
+    "Use simple 6th-7th grade vocabulary only."
+)
+CTA_SYSTEM_PROMPT = WRITER_PREAMBLE + "\n\n" + (
+    "Write 2 short call-to-action sentences. Friendly tone. Under 12 words each."
+)
+
+# SEO meta prompts: the fixed instructions come first and the article-specific
+# values last, so consecutive requests share a prompt prefix Ollama can reuse
+META_DESCRIPTION_SYSTEM_PROMPT = "You are an SEO expert writing meta descriptions."
+META_DESCRIPTION_INSTRUCTIONS = """Write a meta description for this article.
+
+Requirements:
+- Start with the target keyword given below
+- Length: 140-155 characters total
+- Enticing and clear
+
+Just write the description. No explanations."""
+SEO_META_SYSTEM_PROMPT = "You are an SEO expert writing meta descriptions and keywords. Respond only with JSON."
+SEO_META_INSTRUCTIONS = """Write SEO meta data for the article below as a JSON object with exactly these fields:
+- "meta_description": 140-155 characters, starting with the target keyword, enticing and clear
+- "keywords": a list of 5-10 SEO keywords
+
+No explanations."""
+# Plain-text prompts, used if the JSON response cannot be parsed
+META_KEYWORDS_SYSTEM_PROMPT = "You are an SEO expert generating keywords."
+META_KEYWORDS_INSTRUCTIONS = "Generate 5-10 SEO keywords for the article below."
+
+
+@dataclass(frozen=True, slots=True)
+class ArticleRequest:
+    """Validated and sanitized inputs for one article generation."""
+    topic: str
+    target_keyword: str
+    target_word_count: int = 1000
+    target_audience: str = "general readers"
+    content_type: str = "blog_post"
+
+    def __post_init__(self):
+        # Validate inputs
+        if not self.topic or not isinstance(self.topic, str) or len(self.topic.strip()) == 0:
+            raise ValueError("Topic must be a non-empty string")
+        if not self.target_keyword or not isinstance(self.target_keyword, str) or len(self.target_keyword.strip()) == 0:
+            raise ValueError("Target keyword must be a non-empty string")
+        if self.target_word_count <= 0:
+            raise ValueError(f"Target word count must be positive, got {self.target_word_count}")
+        if self.target_word_count > 10000:
+            logger.warning(f"Very large word count requested: {self.target_word_count}. Generation may take significant time.")
+
+        # Sanitize inputs to prevent injection (frozen, so bypass __setattr__)
+        object.__setattr__(self, "topic", self.topic.strip()[:500])  # Limit length
+        object.__setattr__(self, "target_keyword", self.target_keyword.strip()[:100])
+        object.__setattr__(
+            self, "target_audience",
+            self.target_audience.strip()[:200] if self.target_audience else "general readers"
+        )
 
 
 # Type definitions for article structure (maintained for metrics compatibility)
-@dataclass
+@dataclass(slots=True)
 class ArticleSection:
     """Represents a section of the article."""
     heading: str
@@ -39,7 +167,7 @@ class ArticleSection:
     word_count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Article:
     """Complete article structure."""
     title: str
@@ -53,8 +181,55 @@ class Article:
     html_content: Optional[str] = None
 
 
+def count_words(text: str) -> int:
+    """
+    Count whitespace-separated words without building a list of tokens.
+
+    A word starts wherever a non-whitespace byte follows whitespace, so the
+    count is one vectorized comparison over the UTF-8 bytes. Only ASCII
+    whitespace separates words, which matches str.split() for generated text.
+    """
+    in_word = np.frombuffer(text.encode(), dtype=np.uint8) > 32
+    if not in_word.size:
+        return 0
+    return int(in_word[0]) + int(np.count_nonzero(in_word[1:] > in_word[:-1]))
+
+
+def fix_heading_hierarchy(markdown: str) -> str:
+    """
+    Clamp heading levels so none skips a level (H1 -> H3 becomes H1 -> H2).
+
+    The fix is the recurrence fixed[k] = min(raw[k], fixed[k-1] + 1) starting
+    after an H1, which unrolls to k + min(2, min_{j<=k}(raw[j] - j)) and is
+    computed with one cumulative minimum instead of a per-line loop.
+    """
+    matches = list(HEADING_MARKER_RE.finditer(markdown))
+    if not matches:
+        return markdown
+
+    raw = np.fromiter((m.end() - m.start() for m in matches), dtype=np.int64, count=len(matches))
+    index = np.arange(len(raw))
+    fixed = index + np.minimum(np.minimum.accumulate(raw - index), 2)
+
+    changed = np.flatnonzero(fixed != raw)
+    if changed.size == 0:
+        return markdown
+
+    # Splice replacement markers in; untouched text is copied in slices
+    pieces = []
+    position = 0
+    for k in changed:
+        match = matches[k]
+        pieces.append(markdown[position:match.start()])
+        pieces.append('#' * int(fixed[k]))
+        position = match.end()
+    pieces.append(markdown[position:])
+    return ''.join(pieces)
+
+
 # LangGraph State Definition
-class ContentState(TypedDict):
+@dataclass(slots=True)
+class ContentState:
     """State object passed between nodes in the content generation workflow."""
 
     # Input fields
@@ -65,22 +240,24 @@ class ContentState(TypedDict):
     content_type: str
 
     # Intermediate state
-    brand_voice_context: str
-    outline: Dict[str, Any]
-    sections: List[Dict[str, str]]  # List of sections (no operator.add)
-    introduction: str
-    conclusion: str
-    cta: str
+    brand_voice_context: str = ""
+    brand_voice_300: str = ""  # Prompt-sized slices, cut once per article
+    brand_voice_200: str = ""
+    outline: Dict[str, Any] = field(default_factory=dict)
+    sections: List[Dict[str, str]] = field(default_factory=list)  # List of sections (no operator.add)
+    introduction: str = ""
+    conclusion: str = ""
+    cta: str = ""
 
     # Final output
-    article: str
-    meta_description: str
-    meta_keywords: List[str]
+    article: str = ""
+    word_count: int = 0  # Counted once at assembly; heading fixes don't change it
+    meta_description: str = ""
+    meta_keywords: List[str] = field(default_factory=list)
 
     # Control flow
-    current_section_index: int
-    total_sections: int
-    error: Optional[str]
+    total_sections: int = 0
+    error: Optional[str] = None
 
 
 class ContentWriterAgent:
@@ -90,12 +267,10 @@ class ContentWriterAgent:
     Uses LangGraph StateGraph to orchestrate multi-step content generation workflow:
     1. Retrieve brand voice context from ChromaDB
     2. Generate article outline
-    3. Write introduction
-    4. Write body sections (loop)
-    5. Write conclusion
-    6. Generate call-to-action
-    7. Assemble final article
-    8. Optimize for SEO
+    3. Draft introduction, body sections, conclusion, call-to-action and SEO
+       meta data (one concurrent wave of LLM calls)
+    4. Assemble final article
+    5. Validate heading structure
 
     Designed for integration into multi-agent workflows (SEO Strategy Agent, Editor Agent, etc.)
     """
@@ -106,6 +281,18 @@ class ContentWriterAgent:
         self.chroma = VectorStoreHybrid()
         self.llm = OllamaProvider()  # OllamaProvider loads config internally
 
+        # Collections are created by ingestion scripts, rarely at runtime;
+        # refreshed only when a lookup misses
+        self._known_collections = set(self.chroma.list_collections())
+
+        # "collection|normalized topic" -> (unix timestamp, brand voice context),
+        # persisted so restarts and other workers reuse earlier searches
+        self._brand_voice_cache_file = Path(self.config.paths.cache) / "brand_voice_cache.json"
+        self._brand_voice_cache: Dict[str, Tuple[float, str]] = self._load_brand_voice_cache()
+        # Articles are generated concurrently in worker threads; every read,
+        # update and save of the cache happens under this lock
+        self._brand_voice_cache_lock = threading.Lock()
+
         # Build the LangGraph workflow
         self.workflow = self._build_workflow()
         self.app = self.workflow.compile()
@@ -124,31 +311,15 @@ class ContentWriterAgent:
         # Add nodes for each step
         workflow.add_node("retrieve_brand_voice", self._retrieve_brand_voice_node)
         workflow.add_node("generate_outline", self._generate_outline_node)
-        workflow.add_node("write_introduction", self._write_introduction_node)
-        workflow.add_node("write_section", self._write_section_node)
-        workflow.add_node("write_conclusion", self._write_conclusion_node)
-        workflow.add_node("generate_cta", self._generate_cta_node)
+        workflow.add_node("draft_content", self._draft_content_node)
         workflow.add_node("assemble_article", self._assemble_article_node)
         workflow.add_node("optimize_seo", self._optimize_seo_node)
 
         # Define the workflow edges
         workflow.set_entry_point("retrieve_brand_voice")
         workflow.add_edge("retrieve_brand_voice", "generate_outline")
-        workflow.add_edge("generate_outline", "write_introduction")
-        workflow.add_edge("write_introduction", "write_section")
-
-        # Conditional edge for section loop
-        workflow.add_conditional_edges(
-            "write_section",
-            self._should_continue_sections,
-            {
-                "continue": "write_section",
-                "done": "write_conclusion"
-            }
-        )
-
-        workflow.add_edge("write_conclusion", "generate_cta")
-        workflow.add_edge("generate_cta", "assemble_article")
+        workflow.add_edge("generate_outline", "draft_content")
+        workflow.add_edge("draft_content", "assemble_article")
         workflow.add_edge("assemble_article", "optimize_seo")
         workflow.add_edge("optimize_seo", END)
 
@@ -166,6 +337,9 @@ class ContentWriterAgent:
         """
         Generate a complete article using the LangGraph workflow.
 
+        Runs the workflow on a new event loop, so call this from synchronous
+        code only; async callers use :meth:`agenerate_article`.
+
         Args:
             topic: Article topic
             target_keyword: Primary SEO keyword
@@ -177,51 +351,117 @@ class ContentWriterAgent:
         Returns:
             Article object containing all content and metadata
         """
-        # Validate inputs
-        if not topic or not isinstance(topic, str) or len(topic.strip()) == 0:
-            raise ValueError("Topic must be a non-empty string")
-        if not target_keyword or not isinstance(target_keyword, str) or len(target_keyword.strip()) == 0:
-            raise ValueError("Target keyword must be a non-empty string")
-        if target_word_count <= 0:
-            raise ValueError(f"Target word count must be positive, got {target_word_count}")
-        if target_word_count > 10000:
-            logger.warning(f"Very large word count requested: {target_word_count}. Generation may take significant time.")
+        request = ArticleRequest(
+            topic=topic,
+            target_keyword=target_keyword,
+            target_word_count=target_word_count,
+            target_audience=target_audience,
+            content_type=content_type
+        )
+        return self.generate_article_from_request(request, output_path=output_path)
+
+    async def agenerate_article(
+        self,
+        topic: str,
+        target_keyword: str,
+        target_word_count: int = 1000,
+        target_audience: str = "general readers",
+        content_type: str = "blog_post",
+        output_path: Optional[str] = None
+    ) -> Article:
+        """
+        Async variant of :meth:`generate_article` for callers already running
+        an event loop.
+
+        Args:
+            topic: Article topic
+            target_keyword: Primary SEO keyword
+            target_word_count: Target word count (default 1000)
+            target_audience: Target audience description
+            content_type: Type of content (blog_post, guide, tutorial, etc.)
+            output_path: Optional path to save the article markdown
+
+        Returns:
+            Article object containing all content and metadata
+        """
+        request = ArticleRequest(
+            topic=topic,
+            target_keyword=target_keyword,
+            target_word_count=target_word_count,
+            target_audience=target_audience,
+            content_type=content_type
+        )
+        return await self.agenerate_article_from_request(request, output_path=output_path)
+
+    def generate_article_from_request(
+        self,
+        request: ArticleRequest,
+        output_path: Optional[str] = None
+    ) -> Article:
+        """
+        Generate a complete article from an already validated request.
 
-        # Sanitize inputs to prevent injection
-        topic = topic.strip()[:500]  # Limit length
-        target_keyword = target_keyword.strip()[:100]
-        target_audience = target_audience.strip()[:200] if target_audience else "general readers"
+        Synchronous wrapper around :meth:`agenerate_article_from_request`.
 
-        logger.info(f"Starting article generation - Topic: {topic[:50]}..., Keyword: {target_keyword}, Target: {target_word_count} words")
+        Args:
+            request: Validated article inputs
+            output_path: Optional path to save the article markdown
+
+        Returns:
+            Article object containing all content and metadata
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.agenerate_article_from_request(request, output_path=output_path))
+        raise RuntimeError(
+            "generate_article cannot run inside an event loop; await agenerate_article instead"
+        )
+
+    async def agenerate_article_from_request(
+        self,
+        request: ArticleRequest,
+        output_path: Optional[str] = None
+    ) -> Article:
+        """
+        Generate a complete article from an already validated request.
+
+        Cache lookups and file writes run in worker threads so they do not
+        block the caller's event loop.
+
+        Args:
+            request: Validated article inputs
+            output_path: Optional path to save the article markdown
+
+        Returns:
+            Article object containing all content and metadata
+        """
+        if self.config.cache.enabled:
+            cached_article = await asyncio.to_thread(self._get_cached_article, request)
+            if cached_article:
+                if output_path:
+                    await asyncio.to_thread(self._save_article, cached_article, output_path)
+                return cached_article
+
+        logger.info(f"Starting article generation - Topic: {request.topic[:50]}..., Keyword: {request.target_keyword}, Target: {request.target_word_count} words")
 
         # Initialize state
-        initial_state: ContentState = {
-            "topic": topic,
-            "target_keyword": target_keyword,
-            "target_word_count": target_word_count,
-            "target_audience": target_audience,
-            "content_type": content_type,
-            "brand_voice_context": "",
-            "outline": {},
-            "sections": [],
-            "introduction": "",
-            "conclusion": "",
-            "cta": "",
-            "article": "",
-            "meta_description": "",
-            "meta_keywords": [],
-            "current_section_index": 0,
-            "total_sections": 0,
-            "error": None
-        }
+        initial_state = ContentState(
+            topic=request.topic,
+            target_keyword=request.target_keyword,
+            target_word_count=request.target_word_count,
+            target_audience=request.target_audience,
+            content_type=request.content_type
+        )
 
         # Execute the workflow
         try:
-            final_state = self.app.invoke(initial_state)
+            # ainvoke returns the channel values as a dict; rebuild the dataclass
+            final_state = ContentState(**await self.app.ainvoke(initial_state))
 
-            if final_state.get("error"):
-                logger.error(f"Error in workflow: {final_state['error']}")
-                raise ContentGenerationError(final_state["error"])
+            if final_state.error:
+                logger.error(f"Error in workflow: {final_state.error}")
+                raise ContentGenerationError(final_state.error)
 
             logger.info("Article generation completed successfully")
 
@@ -230,7 +470,10 @@ class ContentWriterAgent:
 
             # Save to file if output path provided
             if output_path:
-                self._save_article(article, output_path)
+                await asyncio.to_thread(self._save_article, article, output_path)
+
+            if self.config.cache.enabled:
+                await asyncio.to_thread(self._cache_article, request, article)
 
             return article
 
@@ -241,6 +484,72 @@ class ContentWriterAgent:
             logger.error(f"Unexpected error executing workflow: {str(e)}", exc_info=True)
             raise ContentGenerationError(f"Article generation failed: {str(e)}") from e
 
+    # ========== Article Cache ==========
+
+    @staticmethod
+    def _normalize_topic(topic: str) -> str:
+        """Lowercase and collapse whitespace so trivial edits map to the same key."""
+        return " ".join(topic.lower().split())
+
+    def _article_cache_filter(self, request: ArticleRequest) -> Dict[str, Any]:
+        """Exact-match part of the cache key; the topic is matched semantically."""
+        return {"$and": [
+            {"target_keyword": request.target_keyword.lower()},
+            {"target_word_count": request.target_word_count},
+            {"target_audience": request.target_audience},
+            {"model": self.llm.model},
+        ]}
+
+    def _get_cached_article(self, request: ArticleRequest) -> Optional[Article]:
+        """
+        Return a stored article for a near-identical request, if any.
+
+        Cache failures are logged and treated as a miss.
+        """
+        cache = self.config.cache
+        try:
+            results = self.chroma.query_with_scores(
+                collection_name=cache.collection_name,
+                query_text=self._normalize_topic(request.topic),
+                k=1,
+                where=self._article_cache_filter(request)
+            )
+            if not results:
+                logger.debug("Article cache miss")
+                return None
+
+            doc, similarity = results[0]
+            if similarity < cache.similarity_threshold:
+                logger.debug("Article cache miss (best similarity %.3f)", similarity)
+                return None
+
+            data = json.loads(doc.metadata["article"])
+            data["sections"] = [ArticleSection(**section) for section in data["sections"]]
+            logger.info(f"Article cache hit (similarity {similarity:.3f}), skipping generation")
+            return Article(**data)
+
+        except Exception as e:
+            logger.warning(f"Article cache lookup failed: {str(e)}")
+            return None
+
+    def _cache_article(self, request: ArticleRequest, article: Article) -> None:
+        """Store a generated article under its request key."""
+        try:
+            self.chroma.add_documents(
+                collection_name=self.config.cache.collection_name,
+                texts=[self._normalize_topic(request.topic)],
+                metadatas=[{
+                    "target_keyword": request.target_keyword.lower(),
+                    "target_word_count": request.target_word_count,
+                    "target_audience": request.target_audience,
+                    "model": self.llm.model,
+                    "article": json.dumps(asdict(article), ensure_ascii=False)
+                }],
+                collection_metadata={"hnsw:space": "cosine"}  # relevance == cosine similarity
+            )
+        except Exception as e:
+            logger.warning(f"Failed to cache article: {str(e)}")
+
     def _state_to_article(self, state: ContentState) -> Article:
         """
         Convert workflow state to Article dataclass.
@@ -253,40 +562,48 @@ class ContentWriterAgent:
         """
         # Parse sections from state
         article_sections = []
-        for section_data in state["sections"]:
+        for section_data in state.sections:
             # Extract content without heading
             content = section_data["content"]
-            lines = content.split('\n')
-            heading_line = ""
-            content_lines = []
+            match = SECTION_HEADING_RE.match(content)
+
+            if match and "## " not in content[3:]:
+                # Common case: one leading heading and no other "## " anywhere;
+                # drop blank lines from the body
+                heading_line = match.group("heading").strip()
+                section_content = BLANK_LINES_RE.sub('\n', match.group("body")).strip()
+            else:
+                # More headings, or "## " inside one: keep the last heading line
+                heading_line = ""
+                content_lines = []
 
-            for line in lines:
-                if line.startswith("## "):
-                    heading_line = line.replace("## ", "").strip()
-                elif line.strip():
-                    content_lines.append(line)
+                for line in content.split('\n'):
+                    if line.startswith("## "):
+                        heading_line = line.replace("## ", "").strip()
+                    elif line.strip():
+                        content_lines.append(line)
 
-            section_content = '\n'.join(content_lines).strip()
+                section_content = '\n'.join(content_lines).strip()
 
             article_sections.append(ArticleSection(
                 heading=heading_line or section_data["title"],
                 level=2,
                 content=section_content,
-                word_count=len(section_content.split())
+                word_count=count_words(section_content)
             ))
 
-        # Calculate total word count
-        total_words = len(state["article"].split())
+        # Word count was taken at assembly; no need to re-split the article
+        total_words = state.word_count
 
         return Article(
-            title=state["topic"],
-            meta_description=state["meta_description"],
-            introduction=state["introduction"],
+            title=state.topic,
+            meta_description=state.meta_description,
+            introduction=state.introduction,
             sections=article_sections,
-            conclusion=state["conclusion"],
-            call_to_action=state["cta"],
+            conclusion=state.conclusion,
+            call_to_action=state.cta,
             total_word_count=total_words,
-            markdown_content=state["article"]
+            markdown_content=state.article
         )
 
     def _save_article(self, article: Article, output_path: str) -> None:
@@ -300,10 +617,13 @@ class ContentWriterAgent:
         path = Path(output_path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write(article.markdown_content)
-            f.write("\n\n---\n\n")
-            f.write(f"**Meta Description:** {article.meta_description}\n")
+        # Single write of the whole document through a 1 MiB buffer
+        with open(path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write("".join((
+                article.markdown_content,
+                "\n\n---\n\n",
+                f"**Meta Description:** {article.meta_description}\n"
+            )))
 
         logger.info(f"Article saved to {output_path}")
 
@@ -321,29 +641,62 @@ class ContentWriterAgent:
         # Remove entire first paragraph if it contains meta-text
         paragraphs = text.split('\n\n')
         if paragraphs:
-            first_para_lower = paragraphs[0].lower()
-            meta_indicators = [
-                'here\'s', 'here is', 'okay', 'let me', 'i\'ll', 'i will',
-                'aiming for', 'word count', 'as an ai', 'as a', 'certainly'
-            ]
-            if any(indicator in first_para_lower for indicator in meta_indicators):
+            if META_FIRST_PARA_RE.search(paragraphs[0].lower()):
                 text = '\n\n'.join(paragraphs[1:]) if len(paragraphs) > 1 else paragraphs[0]
 
         # Pattern-based cleaning
-        patterns = [
-            r'^["\'](.+?)["\']$',  # Remove wrapping quotes
-            r'^\s*(Okay,?|Sure,?|Certainly,?)\s+',  # Remove agreement phrases
-            r'^["\']?\s*Here[\'s]+\s+.{0,50}?:\s*["\']?\s*',  # "Here's a/an/the..."
-            r'\n\n---\n\n\*\*Word Count:?\*\*.*$',  # Word count notes
-            r'\*\*\[.*?\]\*\*',  # Markdown link artifacts
-            r'^\s*\[.*?\]\s*',  # [Bracket notes]
-        ]
-
-        for pattern in patterns:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE | re.MULTILINE)
+        for pattern in META_TEXT_PATTERNS:
+            text = pattern.sub('', text)
 
         return text.strip()
 
+    def _load_brand_voice_cache(self) -> Dict[str, Tuple[float, str]]:
+        """Load unexpired brand voice cache entries from disk."""
+        try:
+            with open(self._brand_voice_cache_file, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable brand voice cache: {str(e)}")
+            return {}
+
+        now = time.time()
+        return {
+            key: (timestamp, context)
+            for key, (timestamp, context) in entries.items()
+            if now - timestamp < BRAND_VOICE_CACHE_TTL_SECONDS
+        }
+
+    def _save_brand_voice_cache(self, entries: Dict[str, Tuple[float, str]]) -> None:
+        """Write a snapshot of the brand voice cache atomically (temp file + rename)."""
+        path = self._brand_voice_cache_file
+        tmp_path = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Unique temp name, so concurrent writers never share a temp file
+            with tempfile.NamedTemporaryFile(
+                'w', encoding='utf-8', dir=path.parent, prefix=f"{path.name}.",
+                suffix='.tmp', delete=False
+            ) as f:
+                tmp_path = f.name
+                json.dump(entries, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to persist brand voice cache: {str(e)}")
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _set_brand_voice_context(state: ContentState, context: str) -> None:
+        """Store the brand voice context along with its prompt-sized slices."""
+        state.brand_voice_context = context
+        state.brand_voice_300 = context[:300]
+        state.brand_voice_200 = context[:200]
+
     def _retrieve_brand_voice_node(self, state: ContentState) -> ContentState:
         """
         Node 1: Retrieve relevant brand voice context from ChromaDB.
@@ -357,36 +710,63 @@ class ContentWriterAgent:
             collection_names = self.config.vector_db.collection_names
             collection_name = collection_names.get("brand_voice", "brand_voice_examples")
 
-            # Check if collection exists
-            available_collections = self.chroma.list_collections()
-            if collection_name not in available_collections:
-                logger.warning(f"Collection '{collection_name}' not found. Available: {available_collections}")
-                state["brand_voice_context"] = ""
+            # Repeated topics (ignoring case and spacing) reuse the earlier vector search
+            cache_key = f"{collection_name}|{self._normalize_topic(state.topic)}"
+            with self._brand_voice_cache_lock:
+                cached = self._brand_voice_cache.get(cache_key)
+                if cached and time.time() - cached[0] < BRAND_VOICE_CACHE_TTL_SECONDS:
+                    # Move to the end so eviction drops the least recently used topic
+                    self._brand_voice_cache[cache_key] = self._brand_voice_cache.pop(cache_key)
+                else:
+                    cached = None
+            if cached:
+                logger.debug("Brand voice cache hit for topic: %.50s", state.topic)
+                self._set_brand_voice_context(state, cached[1])
                 return state
+            logger.debug("Brand voice cache miss for topic: %.50s", state.topic)
 
-            # Query ChromaDB for similar brand voice samples
+            # Check if collection exists
+            if collection_name not in self._known_collections:
+                self._known_collections = set(self.chroma.list_collections())
+                if collection_name not in self._known_collections:
+                    logger.warning(f"Collection '{collection_name}' not found. Available: {sorted(self._known_collections)}")
+                    self._set_brand_voice_context(state, "")
+                    return state
+
+            # Query ChromaDB for similar brand voice samples (existence checked above)
             results = self.chroma.query(
                 collection_name=collection_name,
-                query_text=state["topic"],
-                k=3
+                query_text=state.topic,
+                k=3,
+                check_exists=False
             )
 
-            # Format context from results
+            # Format context from results (kept in relevance order: the
+            # prompts only use the leading slice, which should be the best match)
             if results:
                 context_pieces = []
                 for i, doc in enumerate(results):
                     title = doc.metadata.get('title', 'Untitled')
-                    context_pieces.append(f"Example {i+1} - {title}:\n{doc.page_content}")
+                    context_pieces.append(f"Example {i+1} - {title}:\n{doc.page_content[:BRAND_VOICE_EXAMPLE_MAX_CHARS]}")
 
-                state["brand_voice_context"] = "\n\n".join(context_pieces)
+                self._set_brand_voice_context(state, "\n\n".join(context_pieces))
                 logger.info(f"Retrieved {len(results)} brand voice examples")
             else:
-                logger.warning(f"No brand voice found for topic: {state['topic']}. Using default.")
-                state["brand_voice_context"] = DEFAULT_BRAND_VOICE
+                logger.warning(f"No brand voice found for topic: {state.topic}. Using default.")
+                self._set_brand_voice_context(state, DEFAULT_BRAND_VOICE)
+
+            with self._brand_voice_cache_lock:
+                # Re-inserting moves the key to the end; if it is new and the
+                # cache is full, evict the least recently used entry first
+                self._brand_voice_cache.pop(cache_key, None)
+                if len(self._brand_voice_cache) >= BRAND_VOICE_CACHE_MAX_ENTRIES:
+                    self._brand_voice_cache.pop(next(iter(self._brand_voice_cache)))
+                self._brand_voice_cache[cache_key] = (time.time(), state.brand_voice_context)
+                self._save_brand_voice_cache(dict(self._brand_voice_cache))
 
         except (KeyError, ValueError, RuntimeError) as e:
             logger.error(f"Brand voice retrieval failed: {str(e)}", exc_info=True)
-            state["error"] = f"Brand voice retrieval failed: {str(e)}"
+            state.error = f"Brand voice retrieval failed: {str(e)}"
         except Exception as e:
             logger.critical(f"Unexpected error in brand voice retrieval: {str(e)}", exc_info=True)
             raise
@@ -403,35 +783,25 @@ class ContentWriterAgent:
             logger.info("Generating article outline")
 
             # Calculate word count distribution using constants
-            intro_words = int(state["target_word_count"] * INTRO_WORD_RATIO)
-            conclusion_words = int(state["target_word_count"] * CONCLUSION_WORD_RATIO)
-            body_words = state["target_word_count"] - intro_words - conclusion_words
+            intro_words = int(state.target_word_count * INTRO_WORD_RATIO)
+            conclusion_words = int(state.target_word_count * CONCLUSION_WORD_RATIO)
+            body_words = state.target_word_count - intro_words - conclusion_words
 
             # Determine number of sections
             num_sections = max(MIN_SECTIONS, min(MAX_SECTIONS, body_words // WORDS_PER_SECTION))
             words_per_section = body_words // num_sections
 
-            system_prompt = """You are an expert content strategist. Create a clear, logical outline for a blog article.
-
-Requirements:
-- Direct, conversational, simple style
-- Each section should cover one main point
-- Section titles should be descriptive and engaging
-- Logical flow from one section to the next
-
-Respond with ONLY section titles, one per line, no numbering or formatting."""
-
             user_prompt = f"""Create an outline with exactly {num_sections} main sections for this article:
 
-Topic: {state['topic']}
-Keyword: {state['target_keyword']}
-Audience: {state['target_audience']}
+Topic: {state.topic}
+Keyword: {state.target_keyword}
+Audience: {state.target_audience}
 
 List {num_sections} section titles (one per line):"""
 
             response = self.llm.generate(
                 prompt=user_prompt,
-                system_prompt=system_prompt,
+                system_prompt=OUTLINE_SYSTEM_PROMPT,
                 max_tokens=300,
                 temperature=0.7
             )
@@ -448,9 +818,9 @@ List {num_sections} section titles (one per line):"""
             if len(section_titles) < num_sections:
                 # Fill with generic titles if needed
                 for i in range(len(section_titles), num_sections):
-                    section_titles.append(f"Additional Insights on {state['target_keyword']}")
+                    section_titles.append(f"Additional Insights on {state.target_keyword}")
 
-            state["outline"] = {
+            state.outline = {
                 "introduction": {
                     "word_count": intro_words
                 },
@@ -466,36 +836,64 @@ List {num_sections} section titles (one per line):"""
                 }
             }
 
-            state["total_sections"] = len(section_titles)
-            logger.info(f"Generated outline with {state['total_sections']} sections")
+            state.total_sections = len(section_titles)
+            logger.info(f"Generated outline with {state.total_sections} sections")
 
         except (KeyError, ValueError, RuntimeError) as e:
             logger.error(f"Outline generation failed: {str(e)}", exc_info=True)
-            state["error"] = f"Outline generation failed: {str(e)}"
+            state.error = f"Outline generation failed: {str(e)}"
         except Exception as e:
             logger.critical(f"Unexpected error in outline generation: {str(e)}", exc_info=True)
             raise
 
         return state
 
-    def _write_introduction_node(self, state: ContentState) -> ContentState:
+    async def _draft_content_node(self, state: ContentState) -> ContentState:
         """
-        Node 3: Write the article introduction.
+        Node 3: Draft every LLM-written part of the article.
 
-        Creates an engaging introduction with hook, context, and preview.
+        Once the outline exists the introduction, body sections, conclusion,
+        CTA and SEO meta data no longer depend on each other, so all of the
+        calls are issued in a single concurrent wave.
         """
         try:
-            logger.info("Writing introduction")
+            sections_info = state.outline["sections"]
+            logger.info(f"Drafting introduction, {len(sections_info)} sections, conclusion, CTA and meta data concurrently")
+
+            introduction, conclusion, cta, (meta_description, meta_keywords), *sections = await asyncio.gather(
+                self._write_introduction(state),
+                self._write_conclusion(state),
+                self._generate_cta(state),
+                self._generate_seo_meta(state),
+                *[
+                    self._write_section(state, section_index, section_info)
+                    for section_index, section_info in enumerate(sections_info)
+                ]
+            )
 
-            target_words = state["outline"]["introduction"]["word_count"]
+            state.introduction = introduction
+            state.sections = sections
+            state.conclusion = conclusion
+            state.cta = cta
+            state.meta_description = meta_description
+            state.meta_keywords = meta_keywords
 
-            system_prompt = """You are a professional content writer. OUTPUT MUST BE ONLY the article text requested — no explanations, no meta-commentary, no numbered reasoning, and no leading phrases such as "Here's", "Okay", "Let me", "As an AI", "I will". Do not include quotes around the content. Do not add labels like "Introduction:", "Section:", or "Conclusion:" unless explicitly asked. Follow the exact word count and formatting instructions in the user prompt. If you cannot follow the instructions, return exactly the string: [UNABLE_TO_COMPLY].
+        except (KeyError, ValueError, RuntimeError) as e:
+            logger.error(f"Content drafting failed: {str(e)}", exc_info=True)
+            state.error = f"Content drafting failed: {str(e)}"
+        except Exception as e:
+            logger.critical(f"Unexpected error in content drafting: {str(e)}", exc_info=True)
+            raise
 
-CRITICAL: Write with very short sentences (8-14 words average). Most sentences must be 10-12 words. This is essential for readability. Use simple 6th-7th grade vocabulary only."""
+        return state
+
+    async def _write_introduction(self, state: ContentState) -> str:
+        """Write the article introduction (hook, context, and preview)."""
+        target_words = state.outline["introduction"]["word_count"]
 
-            brand_examples = state.get('brand_voice_context', DEFAULT_BRAND_VOICE)
+        brand_examples = state.brand_voice_300
 
-            user_prompt = f"""Write exactly {target_words} words (±5 words) for an introduction about: {state['target_keyword']}
+        user_prompt = f"""Write exactly {target_words} words (±5 words) for an introduction about: {state.target_keyword}
 
 CRITICAL REQUIREMENT - SHORT SENTENCES:
 • MOST sentences must be 8-12 words (this is essential!)
@@ -505,69 +903,54 @@ CRITICAL REQUIREMENT - SHORT SENTENCES:
 
 CONTENT REQUIREMENTS:
 • Start with a short hook (question or fact) - max 10 words
-• Include "{state['target_keyword']}" naturally 2-3 times
+• Include "{state.target_keyword}" naturally 2-3 times
 • Write 4-5 very short paragraphs (2 sentences each)
 • Make it conversational and friendly
 
 Brand voice style:
-{brand_examples[:300]}
+{brand_examples}
 
 Write ONLY the introduction text (exactly {target_words} words):"""
 
-            introduction = self.llm.generate(
-                prompt=user_prompt,
-                system_prompt=system_prompt,
-                max_tokens=2500,
-                temperature=0.7
-            )
-
-            # Clean up meta-text artifacts aggressively
-            introduction = self._clean_meta_text_strict(introduction)
-
-            # Additional cleanup: remove first paragraph if it contains meta-text
-            paragraphs = introduction.split('\n\n')
-            if paragraphs and len(paragraphs) > 1:
-                first_para = paragraphs[0].lower()
-                if any(phrase in first_para for phrase in ['here\'s', 'okay', 'let me', 'aiming for', 'for the']):
-                    introduction = '\n\n'.join(paragraphs[1:])
-
-            state["introduction"] = introduction.strip()
-            logger.info(f"Introduction written: {len(state['introduction'].split())} words")
-
-        except (KeyError, ValueError, RuntimeError) as e:
-            logger.error(f"Introduction writing failed: {str(e)}", exc_info=True)
-            state["error"] = f"Introduction writing failed: {str(e)}"
-        except Exception as e:
-            logger.critical(f"Unexpected error in introduction: {str(e)}", exc_info=True)
-            raise
-
-        return state
-
-    def _write_section_node(self, state: ContentState) -> ContentState:
-        """
-        Node 4: Write a single body section.
-
-        This node is called multiple times in a loop to write all body sections.
-        """
-        try:
-            section_index = state["current_section_index"]
-            section_info = state["outline"]["sections"][section_index]
+        introduction = await self.llm.agenerate(
+            prompt=user_prompt,
+            system_prompt=INTRODUCTION_SYSTEM_PROMPT,
+            max_tokens=min(2500, int(target_words * TOKENS_PER_TARGET_WORD)),
+            temperature=0.7,
+            max_words=int(target_words * WORD_LIMIT_SLACK)
+        )
 
-            logger.info(f"Writing section {section_index + 1}/{state['total_sections']}: {section_info['title']}")
+        # Clean up meta-text artifacts aggressively
+        introduction = self._clean_meta_text_strict(introduction)
 
-            target_words = section_info["word_count"]
+        # Additional cleanup: remove first paragraph if it contains meta-text
+        paragraphs = introduction.split('\n\n')
+        if paragraphs and len(paragraphs) > 1:
+            if INTRO_META_FIRST_PARA_RE.search(paragraphs[0].lower()):
+                introduction = '\n\n'.join(paragraphs[1:])
 
-            system_prompt = """You are a professional content writer. OUTPUT MUST BE ONLY the article text requested — no explanations, no meta-commentary, no numbered reasoning, and no leading phrases such as "Here's", "Okay", "Let me", "As an AI", "I will". Do not include quotes around the content. Do not add labels like "Introduction:", "Section:", or "Conclusion:" unless explicitly asked. Follow the exact word count and formatting instructions in the user prompt. If you cannot follow the instructions, return exactly the string: [UNABLE_TO_COMPLY].
+        introduction = introduction.strip()
+        logger.info(f"Introduction written: {count_words(introduction)} words")
+        return introduction
 
-CRITICAL: Write with very short sentences (8-14 words average). Most sentences must be 10-12 words. Use simple 6th-7th grade vocabulary only. Short paragraphs (2-3 sentences)."""
+    async def _write_section(
+        self,
+        state: ContentState,
+        section_index: int,
+        section_info: Dict[str, Any]
+    ) -> Dict[str, str]:
+        """Write a single body section, returned as ``{"title", "content"}``."""
+        target_words = section_info["word_count"]
 
-            keyword = state['target_keyword']
-            # Calculate keyword density using constant
-            target_keyword_count = max(1, target_words // KEYWORD_FREQUENCY)
+        keyword = state.target_keyword
+        # Calculate keyword density using constant
+        target_keyword_count = max(1, target_words // KEYWORD_FREQUENCY)
 
-            brand_examples = state.get('brand_voice_context', DEFAULT_BRAND_VOICE)
+        brand_examples = state.brand_voice_300
 
-            user_prompt = f"""Write exactly {target_words} words (±10 words) for this section: {section_info['title']}
+        # Everything shared by the article's sections comes first and the
+        # section title last, so Ollama can reuse the cached prompt prefix
+        user_prompt = f"""Write one section of an article.
 
 CRITICAL REQUIREMENT - SHORT SENTENCES:
 • MOST sentences must be 8-12 words (this is essential!)
@@ -583,91 +966,55 @@ CONTENT REQUIREMENTS:
 • Make it conversational
 
 Brand voice style:
-{brand_examples[:300]}
+{brand_examples}
 
-Write ONLY the section content (exactly {target_words} words, no heading):"""
+Length: exactly {target_words} words (±10 words)
+Section: {section_info['title']}
 
-            section_content = self.llm.generate(
-                prompt=user_prompt,
-                system_prompt=system_prompt,
-                max_tokens=3000,
-                temperature=0.7
-            )
-
-            # Clean up meta-text artifacts
-            section_content = self._clean_meta_text_strict(section_content)
-
-            # Ensure proper heading format
-            section_content = section_content.strip()
-            if not section_content.startswith("## "):
-                section_content = f"## {section_info['title']}\n\n{section_content}"
-
-            # Validate word count
-            actual_words = len(section_content.split())
-            if actual_words < target_words * 0.5:
-                logger.warning(f"Section {section_index + 1} too short: {actual_words}/{target_words} words")
-
-            # Append to sections list
-            state["sections"].append({
-                "title": section_info["title"],
-                "content": section_content
-            })
-
-            # Increment section counter
-            state["current_section_index"] += 1
-
-            logger.info(f"Section {section_index + 1} written: {actual_words} words (target: {target_words})")
-
-        except (KeyError, ValueError, RuntimeError) as e:
-            logger.error(f"Section writing failed: {str(e)}", exc_info=True)
-            state["error"] = f"Section writing failed: {str(e)}"
-        except Exception as e:
-            logger.critical(f"Unexpected error in section writing: {str(e)}", exc_info=True)
-            raise
-
-        return state
-
-    def _should_continue_sections(self, state: ContentState) -> str:
-        """
-        Conditional edge function: Determine if more sections need to be written.
-
-        Returns:
-            "continue" if more sections to write, "done" if all sections complete
-        """
-        if state["current_section_index"] < state["total_sections"]:
-            return "continue"
-        else:
-            return "done"
+Write ONLY the section content (exactly {target_words} words, no heading):"""
 
-    def _write_conclusion_node(self, state: ContentState) -> ContentState:
-        """
-        Node 5: Write the article conclusion.
+        section_content = await self.llm.agenerate(
+            prompt=user_prompt,
+            system_prompt=SECTION_SYSTEM_PROMPT,
+            max_tokens=min(3000, int(target_words * TOKENS_PER_TARGET_WORD)),
+            temperature=0.7,
+            max_words=int(target_words * WORD_LIMIT_SLACK)
+        )
 
-        Creates a conclusion that summarizes key points and provides final thoughts.
-        """
-        try:
-            logger.info("Writing conclusion")
+        # Clean up meta-text artifacts
+        section_content = self._clean_meta_text_strict(section_content)
 
-            target_words = state["outline"]["conclusion"]["word_count"]
+        # Ensure proper heading format
+        section_content = section_content.strip()
+        if not section_content.startswith("## "):
+            section_content = f"## {section_info['title']}\n\n{section_content}"
 
-            # Get section titles for summary context
-            [s["title"] for s in state["outline"]["sections"]]
+        # Validate word count
+        actual_words = count_words(section_content)
+        if actual_words < target_words * 0.5:
+            logger.warning(f"Section {section_index + 1} too short: {actual_words}/{target_words} words")
 
-            brand_examples = state.get('brand_voice_context', DEFAULT_BRAND_VOICE)
+        logger.info(f"Section {section_index + 1} written: {actual_words} words (target: {target_words})")
 
-            system_prompt = """You are a professional content writer. OUTPUT MUST BE ONLY the article text requested — no explanations, no meta-commentary, no numbered reasoning, and no leading phrases such as "Here's", "Okay", "Let me", "As an AI", "I will". Do not include quotes around the content. Do not add labels like "Introduction:", "Section:", or "Conclusion:" unless explicitly asked. Follow the exact word count and formatting instructions in the user prompt. If you cannot follow the instructions, return exactly the string: [UNABLE_TO_COMPLY].
+        return {
+            "title": section_info["title"],
+            "content": section_content
+        }
 
-CRITICAL: Write with very short sentences (8-14 words average). Most sentences must be 10-12 words. Use simple 6th-7th grade vocabulary only."""
+    async def _write_conclusion(self, state: ContentState) -> str:
+        """Write a conclusion that summarizes key points and provides final thoughts."""
+        target_words = state.outline["conclusion"]["word_count"]
 
-            # Get section summaries for context
-            key_points = "\n".join([
-                f"- {s['title']}"
-                for s in state["sections"][:3]  # First 3 sections
-            ])
+        # Section titles come from the outline, so the conclusion does not
+        # have to wait for the section bodies
+        key_points = "\n".join([
+            f"- {s['title']}"
+            for s in state.outline["sections"][:3]  # First 3 sections
+        ])
 
-            brand_examples = state.get('brand_voice_context', DEFAULT_BRAND_VOICE)
+        brand_examples = state.brand_voice_200
 
-            user_prompt = f"""Write exactly {target_words} words (±5 words) for a conclusion about {state['target_keyword']}.
+        user_prompt = f"""Write exactly {target_words} words (±5 words) for a conclusion about {state.target_keyword}.
 
 Key points covered:
 {key_points}
@@ -679,126 +1026,196 @@ CRITICAL REQUIREMENT - SHORT SENTENCES:
 • Use simple words only (6th-7th grade level)
 
 CONTENT REQUIREMENTS:
-• Mention "{state['target_keyword']}" once naturally
+• Mention "{state.target_keyword}" once naturally
 • Summarize main takeaways
 • End with encouragement
 • Write 3-4 very short paragraphs
 
 Brand voice style:
-{brand_examples[:200]}
+{brand_examples}
 
 Write ONLY the conclusion text (exactly {target_words} words):"""
 
-            conclusion = self.llm.generate(
-                prompt=user_prompt,
-                system_prompt=system_prompt,
-                max_tokens=2000,
-                temperature=0.7
-            )
+        conclusion = await self.llm.agenerate(
+            prompt=user_prompt,
+            system_prompt=CONCLUSION_SYSTEM_PROMPT,
+            max_tokens=min(2000, int(target_words * TOKENS_PER_TARGET_WORD)),
+            temperature=0.7,
+            max_words=int(target_words * WORD_LIMIT_SLACK)
+        )
 
-            # Clean up meta-text artifacts
-            conclusion = self._clean_meta_text_strict(conclusion)
-            state["conclusion"] = conclusion.strip()
-            logger.info(f"Conclusion written: {len(state['conclusion'].split())} words")
+        # Clean up meta-text artifacts
+        conclusion = self._clean_meta_text_strict(conclusion).strip()
+        logger.info(f"Conclusion written: {count_words(conclusion)} words")
+        return conclusion
 
-        except (KeyError, ValueError, RuntimeError) as e:
-            logger.error(f"Conclusion writing failed: {str(e)}", exc_info=True)
-            state["error"] = f"Conclusion writing failed: {str(e)}"
-        except Exception as e:
-            logger.critical(f"Unexpected error in conclusion: {str(e)}", exc_info=True)
-            raise
+    async def _generate_cta(self, state: ContentState) -> str:
+        """Generate a brief, compelling CTA encouraging reader engagement."""
+        content_config = self.config.content
+        if content_config.cta_mode == "pool" and content_config.cta_pool:
+            # Pick a pre-approved CTA; hashing the keyword keeps the choice
+            # stable for a topic and frees an LLM slot for the sections
+            pool = content_config.cta_pool
+            template = pool[zlib.crc32(self._normalize_topic(state.target_keyword).encode()) % len(pool)]
+            logger.info("Call-to-action selected from pool")
+            return template.replace("{keyword}", state.target_keyword)
 
-        return state
+        user_prompt = f"""Write 2 friendly sentences (under 12 words each) inviting readers to explore {state.target_keyword}.
 
-    def _generate_cta_node(self, state: ContentState) -> ContentState:
+Write ONLY the 2 sentences:"""
+
+        cta = await self.llm.agenerate(
+            prompt=user_prompt,
+            system_prompt=CTA_SYSTEM_PROMPT,
+            max_tokens=300,
+            temperature=0.6
+        )
+
+        logger.info("Call-to-action generated")
+        return cta.strip()
+
+    async def _generate_seo_meta(self, state: ContentState) -> Tuple[str, List[str]]:
         """
-        Node 6: Generate call-to-action.
+        Generate the meta description and SEO keywords with one JSON-mode call.
 
-        Creates a brief, compelling CTA encouraging reader engagement.
+        Falls back to the separate plain-text prompts if the response is not
+        the expected JSON object.
         """
+        seo_prompt = f"""{SEO_META_INSTRUCTIONS}
+
+Topic: {state.topic}
+Target keyword: "{state.target_keyword}"
+
+JSON:"""
+
+        response = await self.llm.agenerate(
+            prompt=seo_prompt,
+            system_prompt=SEO_META_SYSTEM_PROMPT,
+            max_tokens=250,
+            temperature=0.6,
+            format="json"
+        )
+
         try:
-            logger.info("Generating call-to-action")
+            data = json.loads(response)
+            meta_description = data["meta_description"]
+            keywords = data["keywords"]
+            if not isinstance(meta_description, str) or not isinstance(keywords, list):
+                raise TypeError("unexpected field types")
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"SEO meta JSON unusable ({str(e)}), falling back to separate prompts")
+            return await asyncio.gather(
+                self._generate_meta_description(state),
+                self._generate_meta_keywords(state)
+            )
 
-            system_prompt = """You are a professional content writer. OUTPUT MUST BE ONLY the article text requested — no explanations, no meta-commentary, no numbered reasoning, and no leading phrases such as "Here's", "Okay", "Let me", "As an AI", "I will". Do not include quotes around the content.
+        return (
+            self._finalize_meta_description(meta_description, state.target_keyword),
+            self._finalize_meta_keywords(KEYWORD_RE.findall(", ".join(map(str, keywords))), state.target_keyword)
+        )
 
-Write 2 short call-to-action sentences. Friendly tone. Under 12 words each."""
+    @staticmethod
+    def _finalize_meta_description(meta_description: str, keyword: str) -> str:
+        """Lead with the keyword and clamp to 120-160 characters."""
+        meta_description = meta_description.strip().strip('"')
 
-            user_prompt = f"""Write 2 friendly sentences (under 12 words each) inviting readers to explore {state['target_keyword']}.
+        # Ensure keyword is at the start for better SEO (only the prefix is lowered)
+        keyword_first = meta_description[:len(keyword)].lower() == keyword.lower()
+        if keyword_first and 120 <= len(meta_description) <= 160:
+            return meta_description
+        if not keyword_first:
+            meta_description = f"{keyword}: {meta_description}"
 
-Write ONLY the 2 sentences:"""
+        # Validate length (120-160 chars) - target middle of range
+        if len(meta_description) < 120:
+            meta_description = meta_description + f" Learn everything about {keyword}."
+        if len(meta_description) > 160:
+            meta_description = meta_description[:157] + "..."
 
-            cta = self.llm.generate(
-                prompt=user_prompt,
-                system_prompt=system_prompt,
-                max_tokens=300,
-                temperature=0.6
-            )
+        return meta_description
 
-            state["cta"] = cta.strip()
-            logger.info("Call-to-action generated")
+    @staticmethod
+    def _finalize_meta_keywords(keywords: List[str], primary_keyword: str) -> List[str]:
+        """Put the primary keyword first and keep at most 10."""
+        # Ensure primary keyword is first
+        if primary_keyword not in keywords:
+            keywords.insert(0, primary_keyword)
 
-        except (KeyError, ValueError, RuntimeError) as e:
-            logger.error(f"CTA generation failed: {str(e)}", exc_info=True)
-            state["error"] = f"CTA generation failed: {str(e)}"
-        except Exception as e:
-            logger.critical(f"Unexpected error in CTA generation: {str(e)}", exc_info=True)
-            raise
+        return keywords[:10]
 
-        return state
+    async def _generate_meta_description(self, state: ContentState) -> str:
+        """Generate a 120-160 character meta description led by the target keyword."""
+        meta_prompt = f"""{META_DESCRIPTION_INSTRUCTIONS}
+
+Target keyword: "{state.target_keyword}"
+
+Meta description:"""
+
+        meta_description = await self.llm.agenerate(
+            prompt=meta_prompt,
+            system_prompt=META_DESCRIPTION_SYSTEM_PROMPT,
+            max_tokens=100,
+            temperature=0.6
+        )
+
+        return self._finalize_meta_description(meta_description, state.target_keyword)
+
+    async def _generate_meta_keywords(self, state: ContentState) -> List[str]:
+        """Generate 5-10 SEO keywords, primary keyword first."""
+        keywords_prompt = f"""{META_KEYWORDS_INSTRUCTIONS}
+
+Topic: {state.topic}
+Primary Keyword: {state.target_keyword}
+
+List keywords (comma-separated):"""
+
+        keywords_response = await self.llm.agenerate(
+            prompt=keywords_prompt,
+            system_prompt=META_KEYWORDS_SYSTEM_PROMPT,
+            max_tokens=100,
+            temperature=0.7
+        )
+
+        # Parse keywords: one pass yields trimmed, unquoted entries
+        return self._finalize_meta_keywords(KEYWORD_RE.findall(keywords_response), state.target_keyword)
 
     def _assemble_article_node(self, state: ContentState) -> ContentState:
         """
-        Node 7: Assemble all components into final article.
+        Node 4: Assemble all components into final article.
 
         Combines introduction, sections, conclusion, and CTA into complete article.
         """
         try:
             logger.info("Assembling article")
 
-            # Build article parts
-            parts = []
-
             # Title (H1)
-            title = state["topic"]
+            title = state.topic
             if not title.startswith("# "):
                 title = f"# {title}"
-            parts.append(title)
-            parts.append("")  # Blank line
-
-            # Add meta description if available
-            if "meta_description" in state and state["meta_description"]:
-                parts.append(f"*{state['meta_description']}*")
-                parts.append("")  # Blank line
-
-            # Introduction
-            parts.append(state["introduction"])
-            parts.append("")
-
-            # Body sections
-            for section in state["sections"]:
-                parts.append(section["content"])
-                parts.append("")
-
-            # Conclusion
-            parts.append("## Conclusion")
-            parts.append("")
-            parts.append(state["conclusion"])
-            parts.append("")
-
-            # Call-to-action
-            parts.append("---")
-            parts.append("")
-            parts.append(state["cta"])
+
+            # Build article parts in one preallocated list: title and
+            # introduction, each body section, then conclusion and CTA
+            sections = state.sections
+            parts = [""] * (4 + 2 * len(sections) + 7)
+            parts[0] = title
+            parts[2] = state.introduction
+            for i, section in enumerate(sections):
+                parts[4 + 2 * i] = section["content"]
+            tail = 4 + 2 * len(sections)
+            parts[tail] = "## Conclusion"
+            parts[tail + 2] = state.conclusion
+            parts[tail + 4] = "---"
+            parts[tail + 6] = state.cta
 
             # Join all parts
-            state["article"] = "\n".join(parts)
+            state.article = "\n".join(parts)
 
-            word_count = len(state["article"].split())
-            logger.info(f"Article assembled: {word_count} words")
+            state.word_count = count_words(state.article)
+            logger.info(f"Article assembled: {state.word_count} words")
 
         except (KeyError, ValueError, RuntimeError) as e:
             logger.error(f"Article assembly failed: {str(e)}", exc_info=True)
-            state["error"] = f"Article assembly failed: {str(e)}"
+            state.error = f"Article assembly failed: {str(e)}"
         except Exception as e:
             logger.critical(f"Unexpected error in article assembly: {str(e)}", exc_info=True)
             raise
@@ -807,102 +1224,24 @@ Write ONLY the 2 sentences:"""
 
     def _optimize_seo_node(self, state: ContentState) -> ContentState:
         """
-        Node 8: Optimize article for SEO.
+        Node 5: Optimize article for SEO.
 
-        Generates meta description and keywords, validates heading structure.
+        Validates heading structure; meta description and keywords are
+        generated alongside the content in the draft node.
         """
         try:
             logger.info("Optimizing for SEO")
 
-            # Generate meta description
-            meta_prompt = f"""Write a meta description for this article.
-
-Requirements:
-- Start with: "{state['target_keyword']}"
-- Length: 140-155 characters total
-- Enticing and clear
-
-Just write the description. No explanations.
-
-Meta description:"""
-
-            meta_description = self.llm.generate(
-                prompt=meta_prompt,
-                system_prompt="You are an SEO expert writing meta descriptions.",
-                max_tokens=100,
-                temperature=0.6
-            )
-
-            meta_description = meta_description.strip().strip('"')
-
-            # Ensure keyword is at the start for better SEO
-            if not meta_description.lower().startswith(state["target_keyword"].lower()):
-                meta_description = f"{state['target_keyword']}: {meta_description}"
-
-            # Validate length (120-160 chars) - target middle of range
-            if len(meta_description) < 120:
-                meta_description = meta_description + f" Learn everything about {state['target_keyword']}."
-            if len(meta_description) > 160:
-                meta_description = meta_description[:157] + "..."
-
-            state["meta_description"] = meta_description
-
-            # Generate meta keywords (5-10 related keywords)
-            keywords_prompt = f"""Generate 5-10 SEO keywords for this article:
-
-Topic: {state['topic']}
-Primary Keyword: {state['target_keyword']}
-
-List keywords (comma-separated):"""
-
-            keywords_response = self.llm.generate(
-                prompt=keywords_prompt,
-                system_prompt="You are an SEO expert generating keywords.",
-                max_tokens=100,
-                temperature=0.7
-            )
-
-            # Parse keywords
-            keywords = [
-                kw.strip().strip('"\'')
-                for kw in keywords_response.split(',')
-                if kw.strip()
-            ]
-
-            # Ensure primary keyword is first
-            if state["target_keyword"] not in keywords:
-                keywords.insert(0, state["target_keyword"])
-
-            state["meta_keywords"] = keywords[:10]
-
             # Validate heading hierarchy (H1 -> H2 -> H3, no skipping)
-            lines = state["article"].split('\n')
-            fixed_lines = []
-            last_heading_level = 1  # Start with H1
-
-            for line in lines:
-                if line.startswith('#'):
-                    # Count heading level
-                    level = len(line) - len(line.lstrip('#'))
-
-                    # Fix skipped levels (e.g., H1 -> H3 becomes H1 -> H2)
-                    if level > last_heading_level + 1:
-                        level = last_heading_level + 1
-                        line = '#' * level + line.lstrip('#')
-
-                    last_heading_level = level
-
-                fixed_lines.append(line)
-
-            state["article"] = '\n'.join(fixed_lines)
+            state.article = fix_heading_hierarchy(state.article)
 
             logger.info("SEO optimization complete")
-            logger.info(f"Meta description: {len(state['meta_description'])} chars")
-            logger.info(f"Meta keywords: {len(state['meta_keywords'])} keywords")
+            logger.info(f"Meta description: {len(state.meta_description)} chars")
+            logger.info(f"Meta keywords: {len(state.meta_keywords)} keywords")
 
         except (KeyError, ValueError, RuntimeError) as e:
             logger.error(f"SEO optimization failed: {str(e)}", exc_info=True)
-            state["error"] = f"SEO optimization failed: {str(e)}"
+            state.error = f"SEO optimization failed: {str(e)}"
         except Exception as e:
             logger.critical(f"Unexpected error in SEO optimization: {str(e)}", exc_info=True)
             raise
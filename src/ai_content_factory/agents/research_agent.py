@@ -3,16 +3,16 @@ import random
 import time
 import re
 import json
-import feedparser
 from urllib.parse import urlparse, urljoin
+from urllib.robotparser import RobotFileParser
 from datetime import datetime
 from collections import Counter
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
+from operator import itemgetter
 import numpy as np
-from sklearn.cluster import DBSCAN
-from sklearn.feature_extraction.text import TfidfVectorizer
-from transformers import pipeline
-from sentence_transformers import SentenceTransformer
+from lxml import etree, html
+from ..utils.models import encode_embedding, get_sentence_model
 # import textstat
 from typing import List, Dict, Any, Optional
 import logging
@@ -23,18 +23,82 @@ logger = logging.getLogger(__name__)
 # TICKET #4: WEB SCRAPING COMPONENTS
 # =============================================================================
 
+ROBOTS_CACHE_TTL_SECONDS = 3600  # Re-check robots.txt hourly
+MAX_PAGE_BYTES = 2_000_000  # Skip pages whose (decompressed) HTML is larger
+MAX_CONTENT_CHARS = 5000  # Stored blog post text is cut to this length
+
+# Skincare-specific blog link patterns, matched in one pass per href
+BLOG_LINK_RE = re.compile(
+    r'/blog/|/post/|/article/|/journal/'
+    r'|/skincare/|/beauty/|/routine/|/ingredients/'
+    r'|/tips/|/advice/|/guides/|/how-to/'
+    r'|/\d{4}/\d{2}/',  # Date patterns
+    re.IGNORECASE
+)
+# Word tokens for keyword frequency analysis (greedy \w+ already stops at
+# word boundaries, so the former \b anchors only added work)
+WORD_RE = re.compile(r'\w+')
+# Word tokens longer than 3 characters, the length filter done by the regex
+GAP_KEYWORD_RE = re.compile(r'\w{4,}')
+
+
+def _class_xpath(class_name: str) -> str:
+    """XPath equivalent of the CSS class selector ``.class_name``"""
+    return f"//*[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+
+# Main-content candidates in priority order, compiled once; the first
+# expression with a match wins, as with the former CSS selector list
+CONTENT_XPATHS = [
+    etree.XPath(expression) for expression in (
+        "//article", _class_xpath("post-content"), _class_xpath("entry-content"),
+        _class_xpath("blog-content"), _class_xpath("post"), _class_xpath("article-content"),
+        "//main", "//*[@role='main']",
+    )
+]
+UNWANTED_XPATH = etree.XPath("//script | //style | //nav | //footer | //header")
+DATE_XPATHS = [
+    etree.XPath(expression) for expression in (
+        "//time", _class_xpath("post-date"), _class_xpath("published"),
+        _class_xpath("entry-date"), "//*[@datetime]",
+    )
+]
+
+
+def _collapsed_text(element, max_chars: int = MAX_CONTENT_CHARS):
+    """Whitespace-collapsed text of element cut to max_chars, plus its full word count
+
+    Text nodes past max_chars are only counted, so long pages never build
+    the full joined string.
+    """
+    chunks = []
+    length = -1
+    word_count = 0
+    for piece in element.itertext():
+        words = piece.split()
+        word_count += len(words)
+        if words and length < max_chars:
+            chunk = ' '.join(words)
+            chunks.append(chunk)
+            length += len(chunk) + 1
+    return ' '.join(chunks)[:max_chars], word_count
+
+
 class EthicalWebScraper:
     """
     Advanced web scraper with ethical practices and rate limiting
     """
-    def __init__(self, delay_range=(1, 3), max_retries=3):
+    def __init__(self, delay_range=(1, 3), max_retries=3, max_concurrent_domains=8):
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
         self.delay_range = delay_range
         self.max_retries = max_retries
+        self.max_concurrent_domains = max_concurrent_domains
         self.scraped_data = []
+        # domain -> (unix timestamp, parsed robots.txt rules)
+        self._robots_cache = {}
 
     def respectful_delay(self):
         """Implement respectful delay between requests"""
@@ -42,71 +106,107 @@ class EthicalWebScraper:
         time.sleep(delay)
 
     def can_scrape(self, url):
-        """Check robots.txt compliance (basic implementation)"""
+        """Check whether robots.txt allows fetching url
+
+        Each domain's robots.txt is fetched and parsed once per
+        ROBOTS_CACHE_TTL_SECONDS; every URL on it is then checked locally.
+        """
         try:
             domain = urlparse(url).netloc
-            robots_url = f"https://{domain}/robots.txt"
-            response = self.session.get(robots_url, timeout=10)
-            return response.status_code == 200
+            cached = self._robots_cache.get(domain)
+            if cached and time.time() - cached[0] < ROBOTS_CACHE_TTL_SECONDS:
+                rules = cached[1]
+            else:
+                rules = self._fetch_robots_rules(domain)
+                self._robots_cache[domain] = (time.time(), rules)
+            return rules.can_fetch(self.session.headers['User-Agent'], url)
         except:
             return True
 
+    def _fetch_robots_rules(self, domain):
+        """Download and parse a domain's robots.txt (status handling as urllib.robotparser)"""
+        rules = RobotFileParser(f"https://{domain}/robots.txt")
+        response = self.session.get(rules.url, timeout=10)
+        if response.status_code in (401, 403):
+            rules.disallow_all = True
+        elif response.status_code >= 400:
+            rules.allow_all = True
+        else:
+            rules.parse(response.text.splitlines())
+        return rules
+
+    def _fetch_capped(self, url):
+        """Stream a page body, returning None once it exceeds MAX_PAGE_BYTES"""
+        with self.session.get(url, timeout=15, stream=True) as response:
+            response.raise_for_status()
+            if int(response.headers.get('Content-Length') or 0) > MAX_PAGE_BYTES:
+                return None
+
+            body = bytearray()
+            for chunk in response.iter_content(chunk_size=65536):
+                body += chunk
+                if len(body) > MAX_PAGE_BYTES:
+                    return None
+            return bytes(body)
+
     def extract_blog_content(self, url):
         """Extract main content from blog posts"""
         try:
             self.respectful_delay()
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'lxml')
-
-            # Remove unwanted elements
-            for element in soup(['script', 'style', 'nav', 'footer', 'header']):
-                element.decompose()
+            body = self._fetch_capped(url)
+            if body is None:
+                logger.warning(f"Skipping {url}: page larger than {MAX_PAGE_BYTES} bytes")
+                return None
+
+            # Parse and traverse with lxml directly, staying in libxml2.
+            # libxml2 assumes Latin-1 when a page declares no charset, so
+            # valid UTF-8 is parsed as UTF-8 (what BeautifulSoup detected)
+            try:
+                body.decode('utf-8')
+                parser = html.HTMLParser(encoding='utf-8')
+            except UnicodeDecodeError:
+                parser = None
+            tree = html.document_fromstring(body, parser=parser)
+
+            # Empty unwanted elements instead of unlinking them: unlinking
+            # merges their tail into the preceding text and glues words together
+            for element in UNWANTED_XPATH(tree):
+                element.clear(keep_tail=True)
 
             # Try to find main content
-            content_selectors = [
-                'article', '.post-content', '.entry-content',
-                '.blog-content', '.post', '.article-content',
-                'main', '[role="main"]'
-            ]
-
             content = None
-            for selector in content_selectors:
-                content = soup.select_one(selector)
-                if content:
+            for xpath in CONTENT_XPATHS:
+                matches = xpath(tree)
+                if matches:
+                    content = matches[0]
                     break
 
             # Fallback to body if no specific content found
-            if not content:
-                content = soup.find('body')
+            if content is None:
+                content = tree.find('body')
 
-            # Extract text and clean it
-            text = content.get_text(separator=' ', strip=True) if content else ""
-            text = re.sub(r'\s+', ' ', text)
+            # Extract text: whitespace-collapsed words, kept only up to the stored
+            # length but counted over the whole content
+            text, word_count = _collapsed_text(content) if content is not None else ("", 0)
 
             # Extract metadata
-            title = soup.find('title')
-            title = title.text.strip() if title else ""
+            title = tree.find('.//title')
+            title = title.text_content().strip() if title is not None else ""
 
             # Extract publication date
-            date_selectors = [
-                'time', '.post-date', '.published',
-                '.entry-date', '[datetime]'
-            ]
             date = ""
-            for selector in date_selectors:
-                date_element = soup.select_one(selector)
-                if date_element:
-                    date = date_element.get('datetime') or date_element.text
+            for xpath in DATE_XPATHS:
+                matches = xpath(tree)
+                if matches:
+                    date = matches[0].get('datetime') or matches[0].text_content()
                     break
 
             return {
                 'url': url,
                 'title': title,
-                'content': text[:5000],  # Limit content length
+                'content': text,
                 'date': date,
-                'word_count': len(text.split()),
+                'word_count': word_count,
                 'scraped_at': datetime.now().isoformat()
             }
 
@@ -116,27 +216,20 @@ class EthicalWebScraper:
 
     def discover_blog_links(self, domain):
         """Discover blog post URLs from a domain"""
+        from bs4 import BeautifulSoup
+
         try:
             self.respectful_delay()
             response = self.session.get(domain, timeout=15)
             soup = BeautifulSoup(response.content, 'lxml')
 
-            # Skincare-specific blog link patterns
-            blog_patterns = [
-                r'/blog/', r'/post/', r'/article/', r'/journal/',
-                r'/skincare/', r'/beauty/', r'/routine/', r'/ingredients/',
-                r'/tips/', r'/advice/', r'/guides/', r'/how-to/',
-                r'/\d{4}/\d{2}/',  # Date patterns
-            ]
-
             blog_links = []
             for link in soup.find_all('a', href=True):
                 href = link['href']
-                full_url = urljoin(domain, href)
 
                 # Check if link matches blog patterns
-                if any(re.search(pattern, href, re.IGNORECASE) for pattern in blog_patterns):
-                    blog_links.append(full_url)
+                if BLOG_LINK_RE.search(href):
+                    blog_links.append(urljoin(domain, href))
 
             return list(set(blog_links))[:20]  # Limit to 20 links
 
@@ -145,31 +238,47 @@ class EthicalWebScraper:
             return []
 
     def scrape_competitor_blogs(self, competitor_domains, max_posts_per_domain=10):
-        """Scrape multiple competitor blogs"""
-        all_posts = []
+        """Scrape multiple competitor blogs
 
-        for domain in competitor_domains:
-            logger.info(f"Scraping blog posts from: {domain}")
+        Domains are scraped concurrently (one worker per domain), while each
+        domain's own requests stay sequential with the respectful delay
+        between them. Posts are returned grouped in the order of
+        competitor_domains.
+        """
+        if not competitor_domains:
+            return []
 
-            if not self.can_scrape(domain):
-                logger.warning(f"Skipping {domain} due to robots.txt")
-                continue
+        workers = min(len(competitor_domains), self.max_concurrent_domains)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            domain_posts = executor.map(
+                lambda domain: self._scrape_domain(domain, max_posts_per_domain),
+                competitor_domains
+            )
+            return list(chain.from_iterable(domain_posts))
 
-            blog_links = self.discover_blog_links(domain)
-            logger.info(f"Found {len(blog_links)} potential blog posts")
+    def _scrape_domain(self, domain, max_posts_per_domain):
+        """Scrape up to max_posts_per_domain posts from a single blog"""
+        logger.info(f"Scraping blog posts from: {domain}")
 
-            posts_scraped = 0
-            for link in blog_links[:max_posts_per_domain]:
-                post_data = self.extract_blog_content(link)
-                if post_data and post_data['content']:
-                    post_data['domain'] = domain
-                    all_posts.append(post_data)
-                    posts_scraped += 1
-                    logger.info(f"Scraped: {post_data['title'][:50]}...")
+        if not self.can_scrape(domain):
+            logger.warning(f"Skipping {domain} due to robots.txt")
+            return []
 
-            logger.info(f"Total posts scraped from {domain}: {posts_scraped}")
+        blog_links = self.discover_blog_links(domain)
+        logger.info(f"Found {len(blog_links)} potential blog posts on {domain}")
 
-        return all_posts
+        allowed_links = [link for link in blog_links if self.can_scrape(link)]
+
+        posts = []
+        for link in allowed_links[:max_posts_per_domain]:
+            post_data = self.extract_blog_content(link)
+            if post_data and post_data['content']:
+                post_data['domain'] = domain
+                posts.append(post_data)
+                logger.info(f"Scraped: {post_data['title'][:50]}...")
+
+        logger.info(f"Total posts scraped from {domain}: {len(posts)}")
+        return posts
 
 
 class TrendingTopicDiscoverer:
@@ -184,11 +293,31 @@ class TrendingTopicDiscoverer:
             'https://www.paulaschoice.com/expert-advice/rss.xml',
             'https://www.skincare.com/feed/'
         ]
+        # feed URL -> {'etag', 'modified', 'topics'} from the last full fetch,
+        # used for conditional requests
+        self._feed_cache = {}
 
     def parse_rss_feed(self, feed_url):
         """Parse RSS feed and extract trending topics"""
+        import feedparser
+
         try:
-            feed = feedparser.parse(feed_url)
+            # Revalidate with the stored ETag/Last-Modified; an unchanged feed
+            # answers 304 with no body and the previous topics are reused
+            cached = self._feed_cache.get(feed_url)
+
+            # Summaries are only used as text, so skip rewriting relative
+            # links inside every HTML field (a Python-level pass per entry)
+            feed = feedparser.parse(
+                feed_url,
+                etag=cached['etag'] if cached else None,
+                modified=cached['modified'] if cached else None,
+                resolve_relative_uris=False
+            )
+            if cached and feed.get('status') == 304:
+                logger.debug("RSS feed not modified: %s", feed_url)
+                return [dict(topic) for topic in cached['topics']]
+
             topics = []
 
             for entry in feed.entries[:20]:  # Limit to 20 entries per feed
@@ -200,34 +329,44 @@ class TrendingTopicDiscoverer:
                     'source': feed_url
                 })
 
+            if feed.get('etag') or feed.get('modified'):
+                self._feed_cache[feed_url] = {
+                    'etag': feed.get('etag'),
+                    'modified': feed.get('modified'),
+                    'topics': [dict(topic) for topic in topics]
+                }
+
             return topics
         except Exception as e:
             logger.error(f"Error parsing RSS feed {feed_url}: {str(e)}")
             return []
 
     def discover_trending_topics(self):
-        """Discover trending topics from multiple RSS feeds"""
-        all_topics = []
+        """Discover trending topics from multiple RSS feeds
+
+        Feeds come from different hosts, so they are fetched concurrently;
+        topics are returned in the order of self.rss_feeds.
+        """
+        if not self.rss_feeds:
+            return []
+
+        logger.info(f"Parsing {len(self.rss_feeds)} RSS feeds")
+        with ThreadPoolExecutor(max_workers=len(self.rss_feeds)) as executor:
+            feed_topics = list(executor.map(self.parse_rss_feed, self.rss_feeds))
 
-        for feed_url in self.rss_feeds:
-            logger.info(f"Parsing RSS feed: {feed_url}")
-            topics = self.parse_rss_feed(feed_url)
-            all_topics.extend(topics)
-            logger.info(f"Found {len(topics)} topics")
+        for feed_url, topics in zip(self.rss_feeds, feed_topics):
+            logger.info(f"Found {len(topics)} topics in {feed_url}")
 
-        return all_topics
+        return list(chain.from_iterable(feed_topics))
 
     def calculate_relevance_scores(self, topics, keywords_of_interest):
         """Calculate relevance scores for topics based on skincare keywords"""
         scored_topics = []
+        keywords_lower = [keyword.lower() for keyword in keywords_of_interest]
 
         for topic in topics:
-            score = 0
             text = f"{topic['title']} {topic['summary']}".lower()
-
-            for keyword in keywords_of_interest:
-                if keyword.lower() in text:
-                    score += 1
+            score = sum(keyword in text for keyword in keywords_lower)
 
             # Normalize score
             topic['relevance_score'] = min(score / len(keywords_of_interest), 1.0)
@@ -236,28 +375,37 @@ class TrendingTopicDiscoverer:
         return sorted(scored_topics, key=lambda x: x['relevance_score'], reverse=True)
 
 
+def _post_word_counts(posts) -> Counter:
+    """Lowercased word counts over every post, in first-seen order"""
+    counts = Counter()
+    for post in posts:
+        counts.update(WORD_RE.findall(post['content'].lower()))
+    return counts
+
+
 class ContentGapAnalyzer:
     """Analyze content gaps for skincare content"""
     def __init__(self):
         self.scraper = EthicalWebScraper()
         self.topic_discoverer = TrendingTopicDiscoverer()
 
-    def content_gap_analysis(self, scraped_posts, trending_topics, top_n_keywords=20):
+    def content_gap_analysis(self, scraped_posts, trending_topics, top_n_keywords=20,
+                             post_word_counts=None):
         """
         Compare scraped blog posts with trending topics to identify content gaps.
         Returns a list of missing or underrepresented keywords.
+
+        post_word_counts can pass in _post_word_counts(scraped_posts) when the
+        caller has already tokenized the posts.
         """
-        # Extract keywords from scraped posts
-        all_text = " ".join(post['content'] for post in scraped_posts)
-        words = re.findall(r'\b\w+\b', all_text.lower())
-        post_keywords = [w for w in words if len(w) > 3]  # ignore short words
-        post_freq = Counter(post_keywords)
-
-        # Extract keywords from trending topics
-        topic_text = " ".join(topic['title'] + " " + topic['summary'] for topic in trending_topics)
-        topic_words = re.findall(r'\b\w+\b', topic_text.lower())
-        topic_keywords = [w for w in topic_words if len(w) > 3]
-        topic_freq = Counter(topic_keywords)
+        # Only trending keywords are looked up, and those are all longer than
+        # 3 characters, so the full post word counts can be used unfiltered
+        post_freq = post_word_counts if post_word_counts is not None else _post_word_counts(scraped_posts)
+
+        # Count keywords (ignoring short words) topic by topic
+        topic_freq = Counter()
+        for topic in trending_topics:
+            topic_freq.update(GAP_KEYWORD_RE.findall(f"{topic['title']} {topic['summary']}".lower()))
 
         # Identify gaps: trending keywords not common in scraped posts
         gaps = {}
@@ -299,15 +447,20 @@ class ContentGapAnalyzer:
         # Calculate relevance scores
         scored_topics = self.topic_discoverer.calculate_relevance_scores(trending_topics, keywords_of_interest)
 
+        # Tokenize the posts once for both the gap analysis and the insights
+        post_word_counts = _post_word_counts(blog_posts)
+
         # Perform content gap analysis
-        gaps = self.content_gap_analysis(blog_posts, trending_topics, top_n_keywords=20)
+        gaps = self.content_gap_analysis(
+            blog_posts, trending_topics, top_n_keywords=20, post_word_counts=post_word_counts
+        )
 
         # Generate research insights
         research_data = {
             'scraped_posts': blog_posts,
             'trending_topics': scored_topics[:10],  # Top 10 most relevant
             'content_gaps': gaps,
-            'research_insights': self._generate_skincare_insights(blog_posts, scored_topics, gaps),
+            'research_insights': self._generate_skincare_insights(blog_posts, scored_topics, gaps, post_word_counts),
             'metadata': {
                 'total_posts_scraped': len(blog_posts),
                 'total_topics_found': len(scored_topics),
@@ -320,27 +473,29 @@ class ContentGapAnalyzer:
 
         return research_data
 
-    def _generate_skincare_insights(self, posts, topics, gaps):
+    def _generate_skincare_insights(self, posts, topics, gaps, post_word_counts=None):
         """Generate actionable skincare insights from research data"""
+        if post_word_counts is None:
+            post_word_counts = _post_word_counts(posts)
+
         insights = {
             'top_trending_topics': [t['title'] for t in topics[:5]],
             'content_opportunities': list(gaps.keys())[:10],
-            'competitor_coverage_areas': self._analyze_competitor_coverage(posts),
+            'competitor_coverage_areas': self._analyze_competitor_coverage(post_word_counts),
             'recommended_content_themes': self._suggest_skincare_content_themes(topics, gaps)
         }
         return insights
 
-    def _analyze_competitor_coverage(self, posts):
+    def _analyze_competitor_coverage(self, post_word_counts):
         """Analyze what skincare topics competitors are covering"""
-        all_content = " ".join(post['content'] for post in posts)
-        words = [w for w in re.findall(r'\b\w+\b', all_content.lower()) if len(w) > 4]
-        common_topics = Counter(words).most_common(10)
+        words = Counter({w: count for w, count in post_word_counts.items() if len(w) > 4})
+        common_topics = words.most_common(10)
         return [topic for topic, count in common_topics]
 
     def _suggest_skincare_content_themes(self, topics, gaps):
         """Suggest skincare content themes based on gaps and trends"""
         trending_words = " ".join(t['title'] for t in topics[:10]).lower()
-        trending_terms = [w for w in re.findall(r'\b\w+\b', trending_words) if len(w) > 4]
+        trending_terms = [w for w in WORD_RE.findall(trending_words) if len(w) > 4]
         
         gap_terms = list(gaps.keys())[:5]
         
@@ -353,11 +508,57 @@ class ContentGapAnalyzer:
 # TICKET #5: TOPIC ANALYSIS COMPONENTS  
 # =============================================================================
 
+# Common English words longer than 3 characters (shorter words are already
+# skipped by GAP_KEYWORD_RE), excluded from term-frequency key phrases
+KEY_PHRASE_STOP_WORDS = frozenset("""
+    about above after again against also among another because been before
+    being below between both cannot could does doing down during each either
+    even every from further have having here hers herself himself into itself
+    just more most much must myself neither only other ours ourselves over
+    same should since some such than that their theirs them themselves then
+    there these they this those through under until upon very were what when
+    where which while whom whose will with within without would your yours
+    yourself yourselves
+""".split())
+
+
+def _term_frequency_phrases(text: str, max_phrases: int) -> List[Dict]:
+    """Most frequent non-stop-word terms of a lone text, scored by relative frequency"""
+    words = [
+        word for word in GAP_KEYWORD_RE.findall(text.lower())
+        if word not in KEY_PHRASE_STOP_WORDS
+    ]
+    if not words:
+        return []
+    return [
+        {'phrase': word, 'score': count / len(words)}
+        for word, count in Counter(words).most_common(max_phrases)
+    ]
+
+
+def _top_tfidf_phrases(row, feature_names, max_phrases: int, min_score: float) -> List[Dict]:
+    """Top-scoring phrases of a 1-row sparse TF-IDF matrix above min_score
+
+    Only the row's nonzero entries are visited (no densifying); ranking and
+    tie order match sorting every (score, phrase) pair in descending order.
+    """
+    ranked = sorted(zip(row.data, feature_names[row.indices]), reverse=True)
+    return [
+        {'phrase': phrase, 'score': float(score)}
+        for score, phrase in ranked[:max_phrases]
+        if score > min_score
+    ]
+
+
 class LLMTopicAnalyzer:
     """
     LLM-powered topic analysis with clustering and scoring for skincare
     """
-    def __init__(self):
+    def __init__(self, quantize: bool = False):
+        # Heavy ML dependencies are imported on first use so importing this
+        # module (e.g. for the scraper alone) does not initialize PyTorch
+        from transformers import pipeline
+
         try:
             # Use efficient models suitable for CPU
             self.summarizer = pipeline(
@@ -367,41 +568,84 @@ class LLMTopicAnalyzer:
                 framework="pt"
             )
             self.sentiment_analyzer = pipeline("sentiment-analysis")
-            self.sentence_model = SentenceTransformer('all-MiniLM-L6-v2')
+            self.sentence_model = get_sentence_model()
             logger.info("LLMTopicAnalyzer initialized successfully")
         except Exception as e:
             logger.warning(f"Some models failed to load: {e}. Using fallback methods.")
             self.summarizer = None
             self.sentiment_analyzer = None
-            self.sentence_model = SentenceTransformer('all-MiniLM-L6-v2')
+            self.sentence_model = get_sentence_model()
+            return
 
-    def extract_key_phrases(self, text: str, max_phrases: int = 10) -> List[Dict]:
-        """Extract key phrases using TF-IDF with improved error handling"""
-        if not text or len(text.split()) < 5:
-            return []
+        if quantize:
+            self._quantize_pipelines()
+
+    def _quantize_pipelines(self):
+        """Swap the Linear layers of CPU pipelines for dynamic int8 versions
+
+        Weights are stored as int8 and activations quantized on the fly, which
+        shrinks BART's Linear weights about 4x and uses int8 GEMM kernels on CPU.
+        GPU pipelines are left untouched. Opt-in (quantize=True): the effect on
+        summary quality and speed has not been measured yet.
+        """
+        import torch
+
+        for pipe in (self.summarizer, self.sentiment_analyzer):
+            if pipe.device.type != "cpu":
+                continue
+            try:
+                pipe.model = torch.ao.quantization.quantize_dynamic(
+                    pipe.model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+            except Exception as e:
+                logger.warning(f"int8 quantization failed for {pipe.task}, keeping float weights: {e}")
+
+    def fit_key_phrase_vectorizer(self, texts: List[str]):
+        """Fit a key phrase TF-IDF vectorizer on a whole topic corpus
+
+        Fitting once gives phrases real IDF weights across topics (a single
+        document has none) and lets extract_key_phrases only transform the
+        texts of that corpus. Returns None if the fit fails.
+        """
+        from sklearn.feature_extraction.text import TfidfVectorizer
 
         try:
-            vectorizer = TfidfVectorizer(
-                max_features=100, 
-                stop_words='english', 
+            return TfidfVectorizer(
+                max_features=5000,
+                stop_words='english',
                 ngram_range=(1, 3),
                 min_df=1,
                 max_df=0.8
-            )
-            tfidf_matrix = vectorizer.fit_transform([text])
-            feature_names = vectorizer.get_feature_names_out()
-            scores = tfidf_matrix.toarray()[0]
+            ).fit(texts)
+        except ValueError as e:
+            # Too few or too similar documents leave no terms after pruning
+            logger.warning(f"Key phrase vectorizer fit failed: {e}")
+            return None
 
-            # Get top phrases with minimum score threshold
-            key_phrases = []
-            for score, phrase in sorted(zip(scores, feature_names), reverse=True)[:max_phrases]:
-                if score > 0.1:  # Minimum score threshold
-                    key_phrases.append({'phrase': phrase, 'score': float(score)})
+    def extract_key_phrases(self, text: str, max_phrases: int = 10, vectorizer=None,
+                            feature_names=None) -> List[Dict]:
+        """Extract key phrases using TF-IDF with improved error handling
 
-            return key_phrases
-        except Exception as e:
-            logger.warning(f"Key phrase extraction failed: {e}")
+        vectorizer is a corpus fit from fit_key_phrase_vectorizer for the
+        batch text belongs to (feature_names its get_feature_names_out(),
+        passed in to avoid rebuilding it per text); without one the text's
+        most frequent terms are returned.
+        """
+        if not text:
             return []
+        word_count = len(text.split())
+        if word_count < 5:
+            return []
+
+        if vectorizer is not None:
+            if feature_names is None:
+                feature_names = vectorizer.get_feature_names_out()
+            row = vectorizer.transform([text])
+            return _top_tfidf_phrases(row, feature_names, max_phrases, min_score=0.1)
+
+        # A lone document has no IDF signal (and a max_df=0.8 fit on it
+        # prunes every term), so rank its terms by frequency instead
+        return _term_frequency_phrases(text, max_phrases)
 
     def calculate_topic_relevance(self, topic_text: str, target_domain_keywords: List[str]) -> float:
         """Calculate relevance score for skincare topics with improved matching"""
@@ -409,6 +653,7 @@ class LLMTopicAnalyzer:
             return 0.0
 
         text_lower = topic_text.lower()
+        padded_text = f" {text_lower} "
         
         # Weighted matching: exact matches score higher
         matches = 0
@@ -416,62 +661,99 @@ class LLMTopicAnalyzer:
         
         for keyword in target_domain_keywords:
             keyword_lower = keyword.lower()
-            if f" {keyword_lower} " in f" {text_lower} ":
+            if keyword_lower not in text_lower:
+                continue
+            if f" {keyword_lower} " in padded_text:
                 matches += 1  # Exact word match
-            elif keyword_lower in text_lower:
+            else:
                 matches += 0.5  # Partial match
 
         return min(matches / total_possible, 1.0) if total_possible > 0 else 0.0
 
     def generate_topic_brief(self, topic_data: Dict) -> Dict:
         """Generate topic brief using LLM summarization with fallbacks"""
-        try:
-            combined_text = f"{topic_data['title']}. {topic_data.get('summary', '')}"
-            
-            if len(combined_text.strip()) < 10:
-                return self._create_fallback_brief(topic_data)
+        return self.generate_topic_briefs([topic_data])[0]
 
-            summary = combined_text  # Fallback summary
-            
-            # Use LLM summarizer if available and text is substantial
-            if self.summarizer and len(combined_text.split()) > 50:
-                try:
-                    summary = self.summarizer(
-                        combined_text,
-                        max_length=150,
-                        min_length=30,
-                        do_sample=False
-                    )[0]['summary_text']
-                except Exception as e:
-                    logger.warning(f"Summarization failed: {e}")
-
-            # Extract key phrases
-            key_phrases = self.extract_key_phrases(combined_text)
-
-            # Analyze sentiment if analyzer available
-            sentiment_label = "NEUTRAL"
-            sentiment_score = 0.5
-            
-            if self.sentiment_analyzer:
-                try:
-                    sentiment_result = self.sentiment_analyzer(combined_text[:512])[0]
-                    sentiment_label = sentiment_result['label']
-                    sentiment_score = float(sentiment_result['score'])
-                except Exception as e:
-                    logger.warning(f"Sentiment analysis failed: {e}")
+    def generate_topic_briefs(self, topics: List[Dict]) -> List[Dict]:
+        """Generate briefs for many topics, batching the summarizer and sentiment calls
 
-            return {
-                'summary': summary,
-                'key_phrases': key_phrases[:5],  # Top 5 phrases
-                'sentiment': sentiment_label,
-                'sentiment_score': sentiment_score,
-                'estimated_word_count': len(combined_text.split()),
-                'analysis_quality': 'high' if len(key_phrases) > 2 else 'medium'
-            }
-            
-        except Exception as e:
-            logger.error(f"Error generating topic brief: {str(e)}")
-            return self._create_fallback_brief(topic_data)
+        One pipeline call per model amortizes tokenization and dispatch
+        overhead and runs wider matrix multiplications than per-topic calls.
+        If a batched call fails, every topic falls back for that model only.
+        """
+        combined_texts = [f"{topic['title']}. {topic.get('summary', '')}" for topic in topics]
+        analyzable = [i for i, text in enumerate(combined_texts) if len(text.strip()) >= 10]
+
+        # A batch is a corpus: fit key phrase IDF on it, for this batch only
+        vectorizer = feature_names = None
+        if len(analyzable) > 1:
+            vectorizer = self.fit_key_phrase_vectorizer([combined_texts[i] for i in analyzable])
+            if vectorizer is not None:
+                feature_names = vectorizer.get_feature_names_out()
+
+        # Use LLM summarizer if available and text is substantial
+        summaries = {}
+        to_summarize = [i for i in analyzable if len(combined_texts[i].split()) > 50]
+        if self.summarizer and to_summarize:
+            try:
+                results = self.summarizer(
+                    [combined_texts[i] for i in to_summarize],
+                    max_length=150,
+                    min_length=30,
+                    do_sample=False,
+                    truncation=True,  # one over-long topic must not fail the whole batch
+                    batch_size=8
+                )
+                summaries = {i: result['summary_text'] for i, result in zip(to_summarize, results)}
+            except Exception as e:
+                logger.warning(f"Summarization failed: {e}")
+
+        # Analyze sentiment if analyzer available
+        sentiments = {}
+        if self.sentiment_analyzer and analyzable:
+            try:
+                results = self.sentiment_analyzer(
+                    [combined_texts[i][:512] for i in analyzable],
+                    batch_size=32
+                )
+                sentiments = dict(zip(analyzable, results))
+            except Exception as e:
+                logger.warning(f"Sentiment analysis failed: {e}")
+
+        analyzable = set(analyzable)
+        briefs = []
+        for i, topic_data in enumerate(topics):
+            if i not in analyzable:
+                briefs.append(self._create_fallback_brief(topic_data))
+                continue
+            try:
+                key_phrases = self.extract_key_phrases(
+                    combined_texts[i], vectorizer=vectorizer, feature_names=feature_names
+                )
+                briefs.append(self._build_topic_brief(combined_texts[i], summaries.get(i), sentiments.get(i), key_phrases))
+            except Exception as e:
+                logger.error(f"Error generating topic brief: {str(e)}")
+                briefs.append(self._create_fallback_brief(topic_data))
+
+        return briefs
+
+    def _build_topic_brief(self, combined_text: str, summary: Optional[str],
+                           sentiment_result: Optional[Dict], key_phrases: List[Dict]) -> Dict:
+        """Assemble one topic brief from precomputed model outputs"""
+        sentiment_label = "NEUTRAL"
+        sentiment_score = 0.5
+        if sentiment_result:
+            sentiment_label = sentiment_result['label']
+            sentiment_score = float(sentiment_result['score'])
+
+        return {
+            'summary': summary if summary is not None else combined_text,
+            'key_phrases': key_phrases[:5],  # Top 5 phrases
+            'sentiment': sentiment_label,
+            'sentiment_score': sentiment_score,
+            'estimated_word_count': len(combined_text.split()),
+            'analysis_quality': 'high' if len(key_phrases) > 2 else 'medium'
+        }
 
     def _create_fallback_brief(self, topic_data: Dict) -> Dict:
         """Create a fallback brief when analysis fails"""
@@ -489,16 +771,23 @@ class LLMTopicAnalyzer:
 class TopicClusterer:
     """Advanced topic clustering using semantic similarity for skincare"""
     def __init__(self):
-        self.sentence_model = SentenceTransformer('all-MiniLM-L6-v2')
+        self.sentence_model = get_sentence_model()
 
-    def cluster_topics(self, topics: List[Dict], num_clusters: int = 5) -> List[Dict]:
-        """Cluster skincare topics using semantic similarity with adaptive parameters"""
+    def cluster_topics(self, topics: List[Dict], num_clusters: int = 5,
+                       store_embeddings: bool = False) -> List[Dict]:
+        """Cluster skincare topics using semantic similarity with adaptive parameters
+
+        Embeddings are only kept on the topics when store_embeddings is set,
+        under 'embedding_b64' (see utils.models.encode_embedding).
+        """
         if len(topics) < 3:
             # Not enough topics for meaningful clustering
             for i, topic in enumerate(topics):
                 topic['cluster_id'] = i
             return topics
 
+        from sklearn.cluster import DBSCAN
+
         try:
             # Prepare texts for embedding
             texts = [f"{topic['title']} {topic.get('summary', '')}" for topic in topics]
@@ -517,7 +806,8 @@ class TopicClusterer:
             clustered_topics = []
             for i, topic in enumerate(topics):
                 topic['cluster_id'] = int(clustering.labels_[i])
-                topic['embedding'] = embeddings[i].tolist()
+                if store_embeddings:
+                    topic['embedding_b64'] = encode_embedding(embeddings[i])
                 clustered_topics.append(topic)
 
             return clustered_topics
@@ -572,6 +862,8 @@ class TopicClusterer:
         if not text:
             return []
             
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
         try:
             vectorizer = TfidfVectorizer(
                 max_features=50, 
@@ -580,15 +872,7 @@ class TopicClusterer:
                 min_df=1
             )
             tfidf_matrix = vectorizer.fit_transform([text])
-            feature_names = vectorizer.get_feature_names_out()
-            scores = tfidf_matrix.toarray()[0]
-
-            key_phrases = []
-            for score, phrase in sorted(zip(scores, feature_names), reverse=True)[:max_phrases]:
-                if score > 0.05:  # Minimum threshold
-                    key_phrases.append({'phrase': phrase, 'score': float(score)})
-
-            return key_phrases
+            return _top_tfidf_phrases(tfidf_matrix, vectorizer.get_feature_names_out(), max_phrases, min_score=0.05)
         except Exception as e:
             logger.warning(f"Cluster key phrase extraction failed: {e}")
             return []
@@ -698,6 +982,25 @@ class TopicPriorityRanker:
 # MAIN RESEARCH AGENT (COMBINES BOTH TICKETS) - SKINCARE FOCUS
 # =============================================================================
 
+# Content recommendation rules: (title substrings, result), first angle match wins
+CONTENT_ANGLE_RULES = (
+    (('how to', 'tutorial', 'guide', 'routine', 'layering'), "Educational/Step-by-Step Routine"),
+    (('ingredient', 'formula', 'compound', 'active'), "Ingredient Deep Dive"),
+    (('review', 'comparison', 'vs', 'best'), "Product Comparison/Review"),
+    (('treatment', 'solution', 'fix', 'repair'), "Problem-Solution Focused"),
+    (('myth', 'fact', 'truth', 'debunk'), "Myth Busting/Educational"),
+    (('dermatologist', 'expert', 'doctor'), "Expert Advice/Professional Insight"),
+    (('sensitive', 'gentle', 'safe', 'hypoallergenic'), "Sensitive Skin Focus"),
+)
+CONTENT_FORMAT_RULES = (
+    (('routine', 'steps', 'layering'), ("Step-by-Step Guide", "Video Tutorial", "Infographic")),
+    (('ingredient', 'active', 'compound'), ("Deep Dive Article", "Comparison Chart", "Scientific Breakdown")),
+    (('review', 'comparison'), ("Product Review", "Before/After Photos", "User Testimonials")),
+    (('acne', 'eczema', 'rosacea'), ("Condition Guide", "Dermatologist Interview", "Case Study")),
+)
+MEDICAL_RESEARCH_TERMS = ('clinical', 'study', 'research', 'dermatologist')
+
+
 class AdvancedResearchAgent:
     """
     Main Research Agent for Skincare Content Analysis that combines both 
@@ -745,8 +1048,8 @@ class AdvancedResearchAgent:
                 'total_trending_topics': len(research_data.get('trending_topics', [])),
                 'content_gaps_identified': len(research_data.get('content_gaps', {})),
                 'topics_analyzed': len(topic_analysis.get('analyzed_topics', [])),
-                'high_priority_topics': len([t for t in topic_analysis.get('analyzed_topics', []) 
-                                        if t.get('priority_tier') == 'high']),
+                'high_priority_topics': sum(1 for t in topic_analysis.get('analyzed_topics', ())
+                                            if t.get('priority_tier') == 'high'),
                 'analysis_timestamp': datetime.now().isoformat()
             }
         }
@@ -781,15 +1084,17 @@ class AdvancedResearchAgent:
             }
         
         # Combine and prepare topics
-        all_topics = research_data.get('scraped_posts', []) + research_data.get('trending_topics', [])
-        logger.info(f"Analyzing {len(all_topics)} skincare topics...")
+        scraped_posts = research_data.get('scraped_posts', [])
+        trending_topics = research_data.get('trending_topics', [])
+        total_topics = len(scraped_posts) + len(trending_topics)
+        logger.info(f"Analyzing {total_topics} skincare topics...")
         
+        topics = list(islice(chain(scraped_posts, trending_topics), max_topics))
+        briefs = self.topic_analyzer.generate_topic_briefs(topics)
+        logger.info(f"Generated briefs for {len(topics)} topics")
+
         analyzed_topics = []
-        for i, topic in enumerate(all_topics[:max_topics]):
-            if i % 5 == 0:
-                logger.info(f"Analyzed {i}/{min(max_topics, len(all_topics))} topics")
-                
-            brief = self.topic_analyzer.generate_topic_brief(topic)
+        for i, (topic, brief) in enumerate(zip(topics, briefs)):
             relevance = self.topic_analyzer.calculate_topic_relevance(
                 f"{topic.get('title', '')} {topic.get('summary', '')}",
                 self.ranker.domain_keywords
@@ -807,14 +1112,11 @@ class AdvancedResearchAgent:
         clustered_topics = self.clusterer.cluster_topics(analyzed_topics)
         cluster_analysis = self.clusterer.analyze_clusters(clustered_topics)
         
-        # Rank topics by priority
-        prioritized_topics = []
-        for topic in clustered_topics:
-            ranked_topic = self.ranker.calculate_priority_score(topic)
-            prioritized_topics.append(ranked_topic)
+        # Rank topics by priority (every ranked topic carries a priority_score)
+        prioritized_topics = [self.ranker.calculate_priority_score(topic) for topic in clustered_topics]
         
         # Sort by priority score
-        prioritized_topics.sort(key=lambda x: x.get('priority_score', 0), reverse=True)
+        prioritized_topics.sort(key=itemgetter('priority_score'), reverse=True)
         
         # Prepare final analysis
         topic_analysis = {
@@ -824,8 +1126,8 @@ class AdvancedResearchAgent:
             'content_recommendations': self._generate_skincare_content_recommendations(prioritized_topics),
             'analysis_metadata': {
                 'total_topics_analyzed': len(analyzed_topics),
-                'clusters_identified': len([k for k in cluster_analysis.keys() if k != -1]),
-                'high_priority_topics': len([t for t in prioritized_topics if t.get('priority_tier') == 'high']),
+                'clusters_identified': len(cluster_analysis) - (-1 in cluster_analysis),  # -1 is DBSCAN noise
+                'high_priority_topics': sum(1 for t in prioritized_topics if t.get('priority_tier') == 'high'),
                 'analysis_timestamp': datetime.now().isoformat()
             }
         }
@@ -837,47 +1139,33 @@ class AdvancedResearchAgent:
         recommendations = []
         
         for topic in prioritized_topics[:5]:
+            title = topic['title'].lower()
             rec = {
                 'topic_title': topic['title'],
                 'priority_score': topic['priority_score'],
-                'content_angle': self._suggest_skincare_content_angle(topic),
+                'content_angle': self._suggest_skincare_content_angle(title),
                 'target_keywords': [phrase['phrase'] for phrase in topic.get('key_phrases', [])[:3]],
-                'estimated_effort': self._estimate_skincare_content_effort(topic),
-                'content_format': self._suggest_skincare_content_format(topic)
+                'estimated_effort': self._estimate_skincare_content_effort(topic, title),
+                'content_format': self._suggest_skincare_content_format(title)
             }
             recommendations.append(rec)
             
         return recommendations
     
-    def _suggest_skincare_content_angle(self, topic: Dict) -> str:
-        """Suggest skincare-specific content angle based on topic characteristics"""
-        title = topic['title'].lower()
-        
-        # Skincare-specific content angles
-        if any(word in title for word in ['how to', 'tutorial', 'guide', 'routine', 'layering']):
-            return "Educational/Step-by-Step Routine"
-        elif any(word in title for word in ['ingredient', 'formula', 'compound', 'active']):
-            return "Ingredient Deep Dive"
-        elif any(word in title for word in ['review', 'comparison', 'vs', 'best']):
-            return "Product Comparison/Review"
-        elif any(word in title for word in ['treatment', 'solution', 'fix', 'repair']):
-            return "Problem-Solution Focused"
-        elif any(word in title for word in ['myth', 'fact', 'truth', 'debunk']):
-            return "Myth Busting/Educational"
-        elif any(word in title for word in ['dermatologist', 'expert', 'doctor']):
-            return "Expert Advice/Professional Insight"
-        elif any(word in title for word in ['sensitive', 'gentle', 'safe', 'hypoallergenic']):
-            return "Sensitive Skin Focus"
-        else:
-            return "Informational/Skincare Education"
+    def _suggest_skincare_content_angle(self, title: str) -> str:
+        """Suggest skincare-specific content angle from a lowercased topic title"""
+        for terms, angle in CONTENT_ANGLE_RULES:
+            if any(term in title for term in terms):
+                return angle
+        return "Informational/Skincare Education"
     
-    def _estimate_skincare_content_effort(self, topic: Dict) -> str:
+    def _estimate_skincare_content_effort(self, topic: Dict, title: str) -> str:
         """Estimate skincare content creation effort based on complexity"""
         word_count = topic.get('estimated_word_count', 0)
         complexity = len(topic.get('key_phrases', []))
         
         # Skincare topics often require more research for ingredient safety, etc.
-        if any(term in topic['title'].lower() for term in ['clinical', 'study', 'research', 'dermatologist']):
+        if any(term in title for term in MEDICAL_RESEARCH_TERMS):
             return "High (Requires Medical Research)"
         elif word_count > 1200 or complexity > 6:
             return "High"
@@ -886,22 +1174,13 @@ class AdvancedResearchAgent:
         else:
             return "Low"
 
-    def _suggest_skincare_content_format(self, topic: Dict) -> List[str]:
-        """Suggest appropriate content formats for skincare topics"""
-        title = topic['title'].lower()
+    def _suggest_skincare_content_format(self, title: str) -> List[str]:
+        """Suggest appropriate content formats from a lowercased topic title"""
         formats = []
         
-        if any(word in title for word in ['routine', 'steps', 'layering']):
-            formats.extend(["Step-by-Step Guide", "Video Tutorial", "Infographic"])
-        
-        if any(word in title for word in ['ingredient', 'active', 'compound']):
-            formats.extend(["Deep Dive Article", "Comparison Chart", "Scientific Breakdown"])
-        
-        if any(word in title for word in ['review', 'comparison']):
-            formats.extend(["Product Review", "Before/After Photos", "User Testimonials"])
-        
-        if any(word in title for word in ['acne', 'eczema', 'rosacea']):
-            formats.extend(["Condition Guide", "Dermatologist Interview", "Case Study"])
+        for terms, rule_formats in CONTENT_FORMAT_RULES:
+            if any(term in title for term in terms):
+                formats.extend(rule_formats)
         
         # Default formats for skincare content
         if not formats:
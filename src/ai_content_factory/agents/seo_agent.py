@@ -4,11 +4,12 @@ import numpy as np
 from datetime import datetime
 from collections import Counter
 from typing import List, Dict, Any
-from sentence_transformers import SentenceTransformer
+from ..utils.models import encode_embedding, get_sentence_model
 from sklearn.cluster import KMeans
 from sklearn.feature_extraction.text import TfidfVectorizer
 import requests
 
+
 class KeywordResearchTool:
     """
     Advanced keyword research with difficulty estimation and intent classification
@@ -120,10 +121,14 @@ class KeywordClusterer:
     """Cluster keywords by semantic similarity"""
 
     def __init__(self):
-        self.sentence_model = SentenceTransformer('all-MiniLM-L6-v2')
+        self.sentence_model = get_sentence_model()
+
+    def cluster_keywords(self, keywords, num_clusters=8, store_embeddings=True):
+        """Cluster keywords using semantic similarity
 
-    def cluster_keywords(self, keywords, num_clusters=8):
-        """Cluster keywords using semantic similarity"""
+        Embeddings are stored under 'embedding_b64' (see
+        utils.models.encode_embedding) unless store_embeddings is False.
+        """
         if len(keywords) < num_clusters:
             num_clusters = len(keywords) // 2
 
@@ -140,10 +145,10 @@ class KeywordClusterer:
             cluster_id = int(cluster_id)
             if cluster_id not in clustered_keywords:
                 clustered_keywords[cluster_id] = []
-            clustered_keywords[cluster_id].append({
-                'keyword': keyword,
-                'embedding': embeddings[i].tolist()
-            })
+            keyword_entry = {'keyword': keyword}
+            if store_embeddings:
+                keyword_entry['embedding_b64'] = encode_embedding(embeddings[i])
+            clustered_keywords[cluster_id].append(keyword_entry)
 
         return clustered_keywords
 
@@ -276,7 +281,7 @@ class ContentBriefGenerator:
     """Generate comprehensive content briefs based on SERP analysis"""
 
     def __init__(self):
-        self.sentence_model = SentenceTransformer('all-MiniLM-L6-v2')
+        self.sentence_model = get_sentence_model()
 
     def generate_headings_structure(self, keyword, serp_patterns):
         """Generate optimal heading structure"""
@@ -6,13 +6,19 @@ Provides REST API endpoints for content generation, analytics, and management.
 import asyncio
 import json
 import os
+import threading
 import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+import orjson
 from fastapi import BackgroundTasks, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi.responses import FileResponse, HTMLResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
 
@@ -22,16 +28,30 @@ from ..core.metrics import ContentMetricsEvaluator
 from ..core.metrics_logger import MetricsLogger
 from ..utils.logger import get_logger
 
-from src.ai_content_factory.agents.research_agent import AdvancedResearchAgent
-from src.ai_content_factory.agents.seo_agent import SEOStrategyAgent
-
 logger = get_logger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Preload components before the server starts accepting requests."""
+    logger.info("Starting AI Content Factory API...")
+    try:
+        # Run in a worker thread so the event loop stays responsive during model/DB init
+        await asyncio.to_thread(initialize_components)
+        # Load the model weights now so the first generation skips the cold start
+        await asyncio.to_thread(content_agent.llm.warm_up)
+    except Exception as e:
+        logger.warning(f"Could not initialize all components: {e}")
+    yield
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="AI Content Factory",
     description="AI-powered content generation platform",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -53,6 +73,9 @@ metrics_logger = None
 CONTENT_STORAGE_FILE = Path("outputs/content_library.json")
 CONTENT_STORAGE_FILE.parent.mkdir(exist_ok=True)
 
+# Serializes read-modify-write of the library when it is saved off the event loop
+_content_library_lock = threading.Lock()
+
 # Generation status tracking
 generation_status: Dict[str, Dict] = {}
 
@@ -68,64 +91,15 @@ class ContentGenerationRequest(BaseModel):
     target_audience: str = Field(default="general readers")
 
 
-class ContentItem(BaseModel):
-    """Model for a content item in the library."""
-    id: str
-    title: str
-    status: str
-    leads: int
-    ranking: Optional[int]
-    date: str
-    topic: str
-    keyword: str
-    word_count: int
-    content: str
-    meta_description: str
-    metrics: Optional[Dict] = None
-
-
-class SettingsUpdate(BaseModel):
-    """Model for settings updates."""
-    llm_model: Optional[str] = None
-    temperature: Optional[float] = None
-    auto_publish: Optional[bool] = None
-    generate_social: Optional[bool] = None
-    require_fact_check: Optional[bool] = None
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-# ==================== Pydantic Models ====================
-
-class ContentGenerationRequest(BaseModel):
-    """Request model for content generation."""
-    topic: str = Field(..., min_length=3, max_length=200)
-    target_keyword: str = Field(..., min_length=2, max_length=100)
-    word_count: int = Field(default=1500, ge=500, le=5000)
-    content_type: str = Field(default="blog_post")
-    target_audience: str = Field(default="general readers")
-
-# ADD THIS NEW MODEL
 class TopicAnalysisRequest(BaseModel):
     """Request model for topic analysis."""
     domain_keywords: List[str] = None
     max_topics: int = Field(default=25, ge=5, le=100)
 
-class ContentItem(BaseModel):
-    """Model for a content item in the library."""
+
+@dataclass(slots=True)
+class ContentItem:
+    """A content item in the library (internal only, so no request validation)."""
     id: str
     title: str
     status: str
@@ -139,6 +113,7 @@ class ContentItem(BaseModel):
     meta_description: str
     metrics: Optional[Dict] = None
 
+
 class SettingsUpdate(BaseModel):
     """Model for settings updates."""
     llm_model: Optional[str] = None
@@ -148,29 +123,37 @@ class SettingsUpdate(BaseModel):
     require_fact_check: Optional[bool] = None
 
 
+# ==================== Helper Functions ====================
 
+# JSON files keyed by path: (mtime, size) they were read at, raw bytes, parsed data
+_json_cache: Dict[str, Tuple[Tuple[int, int], bytes, object]] = {}
 
 
+def load_json_cached(path, copy: bool = False):
+    """Load a JSON file, reusing the parsed result while the file is unchanged.
 
+    The default result is shared by every caller and must be treated as
+    read-only. Pass ``copy=True`` to get a private object that is safe to
+    mutate (parsed again from the cached bytes, so no disk read).
+    """
+    stat = os.stat(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _json_cache.get(str(path))
+    if cached is not None and cached[0] == stamp:
+        return orjson.loads(cached[1]) if copy else cached[2]
 
+    raw = Path(path).read_bytes()
+    data = orjson.loads(raw)
+    _json_cache[str(path)] = (stamp, raw, data)
+    return orjson.loads(raw) if copy else data
 
 
-
-
-
-
-
-
-
-
-# ==================== Helper Functions ====================
-
 def load_content_library() -> List[Dict]:
     """Load content library from JSON file."""
     if CONTENT_STORAGE_FILE.exists():
         try:
-            with open(CONTENT_STORAGE_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            # Private copy: callers insert, remove and update items
+            return load_json_cached(CONTENT_STORAGE_FILE, copy=True)
         except Exception as e:
             logger.error(f"Error loading content library: {e}")
             return []
@@ -179,6 +162,7 @@ def load_content_library() -> List[Dict]:
 
 def save_content_library(content_list: List[Dict]):
     """Save content library to JSON file."""
+    _json_cache.pop(str(CONTENT_STORAGE_FILE), None)
     try:
         with open(CONTENT_STORAGE_FILE, 'w', encoding='utf-8') as f:
             json.dump(content_list, f, indent=2, ensure_ascii=False)
@@ -186,6 +170,38 @@ def save_content_library(content_list: List[Dict]):
         logger.error(f"Error saving content library: {e}")
 
 
+def add_to_content_library(content_item: Dict):
+    """Prepend an item to the content library."""
+    with _content_library_lock:
+        content_library = load_content_library()
+        content_library.insert(0, content_item)
+        save_content_library(content_library)
+
+
+def remove_from_content_library(content_id: str) -> bool:
+    """Remove an item from the content library. Returns False if it was not found."""
+    with _content_library_lock:
+        content_library = load_content_library()
+        updated_library = [item for item in content_library if item["id"] != content_id]
+        if len(updated_library) == len(content_library):
+            return False
+        save_content_library(updated_library)
+        return True
+
+
+def set_content_status(content_id: str, status: str) -> bool:
+    """Set the status of a library item. Returns False if it was not found."""
+    with _content_library_lock:
+        content_library = load_content_library()
+        for i, item in enumerate(content_library):
+            if item["id"] == content_id:
+                # Replace with an updated copy; never edit loaded items in place
+                content_library[i] = {**item, "status": status}
+                save_content_library(content_library)
+                return True
+        return False
+
+
 def initialize_components():
     """Initialize content generation components."""
     global content_agent, metrics_evaluator, metrics_logger
@@ -234,29 +250,23 @@ async def generate_content_task(
         generation_status[task_id]["progress"] = 70
         generation_status[task_id]["message"] = "Evaluating content quality..."
 
-        # Evaluate metrics
+        # Evaluate metrics while the markdown export is written
         generation_time = time.time() - start_time
-        metrics = metrics_evaluator.evaluate_article(
-            article=article,
-            target_word_count=request.word_count,
-            primary_keyword=request.target_keyword,
-            generation_time=generation_time
-        )
-
-        # Log metrics
-        metrics_logger.log_metrics(
-            metrics=metrics,
-            metadata={
-                "topic": request.topic,
-                "keyword": request.target_keyword,
-                "word_count": request.word_count
-            }
+        output_file = Path("outputs") / f"{task_id}.md"
+        metrics, _ = await asyncio.gather(
+            asyncio.to_thread(
+                metrics_evaluator.evaluate_article,
+                article=article,
+                target_word_count=request.word_count,
+                primary_keyword=request.target_keyword,
+                generation_time=generation_time
+            ),
+            asyncio.to_thread(output_file.write_text, article.markdown_content, encoding='utf-8')
         )
 
         generation_status[task_id]["progress"] = 90
         generation_status[task_id]["message"] = "Saving content..."
 
-        # Save to library
         content_item = {
             "id": task_id,
             "title": article.title,
@@ -272,13 +282,19 @@ async def generate_content_task(
             "metrics": metrics.to_dict()
         }
 
-        content_library = load_content_library()
-        content_library.insert(0, content_item)
-        save_content_library(content_library)
-
-        # Save markdown file
-        output_file = Path("outputs") / f"{task_id}.md"
-        output_file.write_text(article.markdown_content, encoding='utf-8')
+        # Log metrics and save to library concurrently; they touch different files
+        await asyncio.gather(
+            asyncio.to_thread(
+                metrics_logger.log_metrics,
+                metrics=metrics,
+                metadata={
+                    "topic": request.topic,
+                    "keyword": request.target_keyword,
+                    "word_count": request.word_count
+                }
+            ),
+            asyncio.to_thread(add_to_content_library, content_item)
+        )
 
         generation_status[task_id] = {
             "status": "completed",
@@ -299,16 +315,6 @@ async def generate_content_task(
 
 # ==================== API Endpoints ====================
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize components on startup."""
-    logger.info("Starting AI Content Factory API...")
-    try:
-        initialize_components()
-    except Exception as e:
-        logger.warning(f"Could not initialize all components: {e}")
-
-
 @app.get("/", response_class=HTMLResponse)
 async def root():
     """Serve the main dashboard HTML."""
@@ -386,14 +392,9 @@ async def get_content(content_id: str):
 @app.delete("/api/content/{content_id}")
 async def delete_content(content_id: str):
     """Delete content from library."""
-    content_library = load_content_library()
-    updated_library = [item for item in content_library if item["id"] != content_id]
-
-    if len(updated_library) == len(content_library):
+    if not await asyncio.to_thread(remove_from_content_library, content_id):
         raise HTTPException(status_code=404, detail="Content not found")
 
-    save_content_library(updated_library)
-
     # Try to delete the markdown file
     try:
         output_file = Path("outputs") / f"{content_id}.md"
@@ -411,15 +412,9 @@ async def update_content_status(content_id: str, status: str):
     if status not in ["draft", "review", "published"]:
         raise HTTPException(status_code=400, detail="Invalid status")
 
-    content_library = load_content_library()
-    content = next((item for item in content_library if item["id"] == content_id), None)
-
-    if not content:
+    if not await asyncio.to_thread(set_content_status, content_id, status):
         raise HTTPException(status_code=404, detail="Content not found")
 
-    content["status"] = status
-    save_content_library(content_library)
-
     return {"message": f"Status updated to {status}"}
 
 
@@ -433,8 +428,7 @@ async def get_dashboard_analytics():
     metrics_history = []
     if metrics_file.exists():
         try:
-            with open(metrics_file, 'r', encoding='utf-8') as f:
-                metrics_history = json.load(f)
+            metrics_history = load_json_cached(metrics_file)
         except Exception as e:
             logger.error(f"Error loading metrics history: {e}")
 
@@ -554,8 +548,7 @@ async def get_metrics_history():
         return []
 
     try:
-        with open(metrics_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return load_json_cached(metrics_file)
     except Exception as e:
         logger.error(f"Error loading metrics: {e}")
         return []
@@ -634,16 +627,23 @@ if __name__ == "__main__":
 
 
 
-class TopicAnalysisRequest(BaseModel):
-    """Request model for topic analysis."""
-    domain_keywords: List[str] = None
-    max_topics: int = Field(default=25, ge=5, le=100)
+@lru_cache(maxsize=4)
+def get_research_agent(domain_keywords: Optional[Tuple[str, ...]] = None):
+    """Return a research agent for the given keywords, building it only once.
+
+    Constructing an AdvancedResearchAgent loads the summarization, sentiment
+    and sentence-embedding models, so instances are reused across requests.
+    """
+    from ..agents.research_agent import AdvancedResearchAgent
+
+    return AdvancedResearchAgent(domain_keywords=list(domain_keywords) if domain_keywords else None)
+
 
 @app.post("/api/research/analyze-competitors")
 async def analyze_competitors(competitor_domains: List[str] = None, keywords: List[str] = None):
     """Analyze competitor content and identify gaps"""
     try:
-        analyzer = AdvancedResearchAgent(domain_keywords=keywords or ['ai', 'technology', 'digital', 'innovation'])
+        analyzer = get_research_agent(tuple(keywords or ['ai', 'technology', 'digital', 'innovation']))
         research_data = analyzer.comprehensive_research_analysis(
             competitor_domains=competitor_domains,
             keywords_of_interest=keywords,
@@ -670,8 +670,7 @@ async def get_research_insights():
     try:
         research_file = "metrics_logs/research_data.json"
         if os.path.exists(research_file):
-            with open(research_file, 'r', encoding='utf-8') as f:
-                research_data = json.load(f)
+            research_data = load_json_cached(research_file)
             return {"status": "success", "data": research_data}
         else:
             return {"status": "error", "message": "No research data available"}
@@ -707,8 +706,8 @@ async def analyze_topics(
                 "domain_keywords": request.domain_keywords or ['skincare', 'beauty', 'routine', 'ingredients'],
                 "max_topics": request.max_topics or 25
             }
-            
-        research_agent = AdvancedResearchAgent(domain_keywords=request_data['domain_keywords'])
+
+        research_agent = get_research_agent(tuple(request_data['domain_keywords']))
         analysis_result = research_agent.comprehensive_topic_analysis(max_topics=request_data['max_topics'])
         
         # Save analysis
@@ -731,8 +730,7 @@ async def get_topic_recommendations():
     try:
         analysis_file = "metrics_logs/topic_analysis.json"
         if os.path.exists(analysis_file):
-            with open(analysis_file, 'r', encoding='utf-8') as f:
-                analysis_data = json.load(f)
+            analysis_data = load_json_cached(analysis_file)
             
             recommendations = {
                 "top_priority_topics": analysis_data.get('top_priority_topics', [])[:5],
@@ -750,10 +748,8 @@ async def get_topic_recommendations():
 async def test_research_agent():
     """Test endpoint for research agent functionality"""
     try:
-        from src.ai_content_factory.agents.research_agent import AdvancedResearchAgent
-        
         # Quick initialization test
-        agent = AdvancedResearchAgent()
+        agent = get_research_agent()
         
         return {
             "status": "success",
@@ -796,7 +792,19 @@ async def test_research_agent():
 
 
 
-seo_agent = SEOStrategyAgent()
+seo_agent = None
+
+
+def get_seo_agent():
+    """Create the SEO agent on first use; its embedding model is heavy to import."""
+    global seo_agent
+
+    if seo_agent is None:
+        from ..agents.seo_agent import SEOStrategyAgent
+
+        seo_agent = SEOStrategyAgent()
+    return seo_agent
+
 
 class KeywordResearchRequest(BaseModel):
     seed_topics: List[str]
@@ -811,7 +819,7 @@ async def research_keywords(request: KeywordResearchRequest):
     try:
         print(f"Received keyword research request: {request.seed_topics}")
         
-        research_data = seo_agent.research_keywords(
+        research_data = get_seo_agent().research_keywords(
             request.seed_topics, 
             request.max_keywords_per_topic
         )
@@ -841,10 +849,9 @@ async def generate_briefs(request: BriefGenerationRequest):
         if not os.path.exists(research_file):
             return {"status": "error", "message": "No keyword research data available. Run keyword research first."}
             
-        with open(research_file, 'r', encoding='utf-8') as f:
-            keyword_data = json.load(f)
+        keyword_data = load_json_cached(research_file)
             
-        briefs_data = seo_agent.generate_content_briefs(
+        briefs_data = get_seo_agent().generate_content_briefs(
             keyword_data['keywords'], 
             request.max_briefs
         )
@@ -871,8 +878,7 @@ async def get_content_briefs():
     try:
         briefs_file = "metrics_logs/seo_content_briefs.json"
         if os.path.exists(briefs_file):
-            with open(briefs_file, 'r', encoding='utf-8') as f:
-                briefs_data = json.load(f)
+            briefs_data = load_json_cached(briefs_file)
             return {"status": "success", "data": briefs_data}
         else:
             return {"status": "error", "message": "No content briefs available"}
@@ -885,8 +891,7 @@ async def get_brief(brief_id: str):
     try:
         briefs_file = "metrics_logs/seo_content_briefs.json"
         if os.path.exists(briefs_file):
-            with open(briefs_file, 'r', encoding='utf-8') as f:
-                briefs_data = json.load(f)
+            briefs_data = load_json_cached(briefs_file)
                 
             brief = next((b for b in briefs_data['content_briefs'] if b['brief_id'] == brief_id), None)
             if brief:
@@ -917,8 +922,7 @@ async def get_seo_insights():
         # Load keyword research data
         keyword_file = "metrics_logs/seo_keyword_research.json"
         if os.path.exists(keyword_file):
-            with open(keyword_file, 'r', encoding='utf-8') as f:
-                keyword_data = json.load(f)
+            keyword_data = load_json_cached(keyword_file)
             
             keywords = keyword_data.get('keywords', [])
             
@@ -997,8 +1001,7 @@ async def get_seo_insights():
         # Load research data for content gaps
         research_file = "metrics_logs/research_data.json"
         if os.path.exists(research_file):
-            with open(research_file, 'r', encoding='utf-8') as f:
-                research_data = json.load(f)
+            research_data = load_json_cached(research_file)
             
             web_data = research_data.get('web_scraping_results', {})
             content_gaps = web_data.get('content_gaps', {})
@@ -1017,8 +1020,7 @@ async def get_seo_insights():
         # Load topic analysis for performance
         topic_file = "metrics_logs/topic_analysis.json"
         if os.path.exists(topic_file):
-            with open(topic_file, 'r', encoding='utf-8') as f:
-                topic_data = json.load(f)
+            topic_data = load_json_cached(topic_file)
             
             top_topics = topic_data.get('top_priority_topics', [])
             insights['topic_performance'] = [
@@ -1047,8 +1049,7 @@ async def get_content_effectiveness():
         metrics_history = []
         
         if metrics_file.exists():
-            with open(metrics_file, 'r', encoding='utf-8') as f:
-                metrics_history = json.load(f)
+            metrics_history = load_json_cached(metrics_file)
         
         effectiveness = {
             "content_by_keyword": {},
@@ -1148,8 +1149,7 @@ async def get_search_performance():
         # Load keyword research
         keyword_file = "metrics_logs/seo_keyword_research.json"
         if os.path.exists(keyword_file):
-            with open(keyword_file, 'r', encoding='utf-8') as f:
-                keyword_data = json.load(f)
+            keyword_data = load_json_cached(keyword_file)
             
             keywords = keyword_data.get('keywords', [])
             
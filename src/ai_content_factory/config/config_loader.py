@@ -2,7 +2,7 @@ from pydantic import BaseModel
 from pydantic_settings import BaseSettings
 from pathlib import Path
 import yaml
-from typing import Dict, Optional
+from typing import Dict, List, Literal, Optional
 
 from ai_content_factory.utils.exceptions import ConfigurationError
 
@@ -19,6 +19,8 @@ class LLMConfig(BaseModel):
     temperature: float = 0.7
     max_tokens: int = 1024
     timeout_seconds: int = 30
+    keep_alive: str = "30m"  # how long Ollama keeps the model loaded between requests
+    num_parallel: int = 4  # concurrent requests per provider; match OLLAMA_NUM_PARALLEL
 
 class VectorDBConfig(BaseModel):
     persist_directory: str
@@ -29,11 +31,31 @@ class LoggingConfig(BaseModel):
     level: str = "INFO"
     log_file: str = "./logs/app.log"
 
+class PathsConfig(BaseModel):
+    logs: str = "./logs/"
+    outputs: str = "./outputs/"
+    datasets: str = "./datasets/"
+    cache: str = "./.cache/"
+
+class CacheConfig(BaseModel):
+    enabled: bool = False  # reuse a stored article for a near-identical request
+    collection_name: str = "article_cache"
+    similarity_threshold: float = 0.97  # cosine similarity of normalized topics
+
+class ContentConfig(BaseModel):
+    # "pool" picks a pre-approved CTA without an LLM call; "dynamic" generates one
+    cta_mode: Literal["pool", "dynamic"] = "pool"
+    # Pre-approved CTAs are listed in config.yaml; an empty pool falls back to dynamic
+    cta_pool: List[str] = []
+
 class AppConfig(BaseSettings):
     project: ProjectConfig
     llm: LLMConfig
     vector_db: VectorDBConfig
     logging: LoggingConfig
+    cache: CacheConfig = CacheConfig()
+    content: ContentConfig = ContentConfig()
+    paths: PathsConfig = PathsConfig()
 
     class Config:
         env_prefix = "AICF_"  # allow overrides like AICF_LLM__MODEL
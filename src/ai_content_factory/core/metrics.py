@@ -3,16 +3,19 @@
 import re
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 
 from ..agents.content_writer_agent import Article
 from ..config.config_loader import load_config
 from ..database.chroma_manager import VectorStoreHybrid
+from ..utils.logger import get_logger
 
+logger = get_logger(__name__)
 
-@dataclass
+
+@dataclass(slots=True)
 class ContentMetrics:
     """Metrics for evaluating generated content."""
 
@@ -106,22 +109,27 @@ class ContentMetricsEvaluator:
         Returns:
             ContentMetrics with all scores
         """
+        # Shared intermediate results, computed once and reused by scores and details
+        keyword_occurrences = self._count_keyword_occurrences(article, primary_keyword)
+        heading_issues = self._check_heading_hierarchy(article)
+        seo_checklist = self._get_seo_checklist(article, primary_keyword)
+
         # Calculate individual metrics
         quality_score = self._calculate_quality_score(article)
         brand_voice_sim = self._calculate_brand_voice_similarity(article)
-        keyword_density = self._calculate_keyword_density(article, primary_keyword)
+        keyword_density = self._calculate_keyword_density(article, primary_keyword, keyword_occurrences)
         readability = self._calculate_readability(article)
         word_count_acc = self._calculate_word_count_accuracy(article, target_word_count)
-        heading_score = self._evaluate_heading_structure(article)
-        seo_score = self._evaluate_seo_requirements(article, primary_keyword)
+        heading_score = self._evaluate_heading_structure(article, heading_issues)
+        seo_score = self._evaluate_seo_requirements(article, primary_keyword, seo_checklist)
 
         # Compile details
         details = {
             'actual_word_count': article.total_word_count,
             'target_word_count': target_word_count,
-            'keyword_occurrences': self._count_keyword_occurrences(article, primary_keyword),
-            'heading_hierarchy_issues': self._check_heading_hierarchy(article),
-            'seo_checklist': self._get_seo_checklist(article, primary_keyword)
+            'keyword_occurrences': keyword_occurrences,
+            'heading_hierarchy_issues': heading_issues,
+            'seo_checklist': seo_checklist
         }
 
         return ContentMetrics(
@@ -226,24 +234,27 @@ class ContentMetricsEvaluator:
             return 0.85  # Placeholder - would need actual embedding comparison
 
         except Exception as e:
-            print(f"⚠️  Brand voice similarity calculation failed: {str(e)}")
+            logger.warning(f"Brand voice similarity calculation failed: {str(e)}")
             return 0.0
 
-    def _calculate_keyword_density(self, article: Article, keyword: str) -> float:
+    def _calculate_keyword_density(
+        self,
+        article: Article,
+        keyword: str,
+        occurrences: Optional[int] = None
+    ) -> float:
         """Calculate keyword density as percentage.
 
         Args:
             article: The article to analyze
             keyword: The primary keyword
+            occurrences: Precomputed keyword count, if already available
 
         Returns:
             Keyword density as percentage (e.g., 1.5 for 1.5%)
         """
-        text = article.markdown_content.lower()
-        keyword_lower = keyword.lower()
-
         # Count occurrences
-        count = text.count(keyword_lower)
+        count = occurrences if occurrences is not None else self._count_keyword_occurrences(article, keyword)
 
         # Total words
         total_words = article.total_word_count
@@ -339,12 +350,13 @@ class ContentMetricsEvaluator:
 
         return max(0, accuracy)
 
-    def _evaluate_heading_structure(self, article: Article) -> float:
+    def _evaluate_heading_structure(self, article: Article, issues: Optional[List[str]] = None) -> float:
         """Evaluate heading hierarchy (H1→H2→H3).
 
         Returns 1.0 if perfect, lower scores for issues.
         """
-        issues = self._check_heading_hierarchy(article)
+        if issues is None:
+            issues = self._check_heading_hierarchy(article)
 
         if len(issues) == 0:
             return 1.0
@@ -363,32 +375,33 @@ class ContentMetricsEvaluator:
             issues.append("No headings found")
             return issues
 
+        levels = np.fromiter((len(marks) for marks, _ in headings), dtype=np.int8, count=len(headings))
+
         # Check for H1
-        h1_count = sum(1 for h in headings if len(h[0]) == 1)
+        h1_count = int(np.count_nonzero(levels == 1))
         if h1_count == 0:
             issues.append("Missing H1")
         elif h1_count > 1:
             issues.append(f"Multiple H1 tags ({h1_count})")
 
-        # Check hierarchy
-        prev_level = 0
-        for heading_marks, heading_text in headings:
-            level = len(heading_marks)
-
-            # Check for skipping levels
-            if level > prev_level + 1 and prev_level > 0:
-                issues.append(f"Skipped heading level: H{prev_level} → H{level}")
-
-            prev_level = level
+        # Check hierarchy: a heading may go at most one level deeper than the previous one
+        for i in np.flatnonzero(levels[1:] > levels[:-1] + 1):
+            issues.append(f"Skipped heading level: H{levels[i]} → H{levels[i + 1]}")
 
         return issues
 
-    def _evaluate_seo_requirements(self, article: Article, keyword: str) -> float:
+    def _evaluate_seo_requirements(
+        self,
+        article: Article,
+        keyword: str,
+        checklist: Optional[Dict[str, bool]] = None
+    ) -> float:
         """Evaluate SEO requirements (keyword in title, intro, conclusion).
 
         Returns score from 0 to 1.
         """
-        checklist = self._get_seo_checklist(article, keyword)
+        if checklist is None:
+            checklist = self._get_seo_checklist(article, keyword)
 
         passed = sum(1 for v in checklist.values() if v)
         total = len(checklist)
@@ -1,6 +1,6 @@
 # chroma_manager_hybrid.py
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import chromadb
 from chromadb.config import Settings
@@ -42,21 +42,24 @@ class VectorStoreHybrid:
         return [c.name for c in self.client.list_collections()]
 
     # use LangChain Chroma for adds & queries
-    def add_documents(self, collection_name: str, texts: List[str], metadatas: List[Dict[str,Any]], ids: Optional[List[str]] = None):
+    def add_documents(self, collection_name: str, texts: List[str], metadatas: List[Dict[str,Any]], ids: Optional[List[str]] = None,
+                      collection_metadata: Optional[Dict[str, Any]] = None):
         vs = Chroma(
             collection_name=collection_name,
             embedding_function=self.lc_embedding,
-            client=self.client  # Reuse existing client
+            client=self.client,  # Reuse existing client
+            collection_metadata=collection_metadata  # Only applied when the collection is created
         )
         vs.add_texts(texts=texts, metadatas=metadatas, ids=ids)
         return len(texts)
 
-    def query(self, collection_name: str, query_text: str, k: int = 5):
-        # Validate collection exists
-        available = self.list_collections()
-        if collection_name not in available:
-            logger.warning(f"Collection '{collection_name}' not found. Available: {available}")
-            return []  # Return empty results instead of failing
+    def query(self, collection_name: str, query_text: str, k: int = 5, check_exists: bool = True):
+        # Validate collection exists (callers that already know it does can skip the round trip)
+        if check_exists:
+            available = self.list_collections()
+            if collection_name not in available:
+                logger.warning(f"Collection '{collection_name}' not found. Available: {available}")
+                return []  # Return empty results instead of failing
 
         # Validate parameters
         if not query_text or len(query_text.strip()) == 0:
@@ -76,6 +79,26 @@ class VectorStoreHybrid:
             logger.error(f"Error querying collection '{collection_name}': {str(e)}")
             return []  # Graceful degradation
 
+    def query_with_scores(self, collection_name: str, query_text: str, k: int = 5,
+                          where: Optional[Dict[str, Any]] = None) -> List[Tuple[Any, float]]:
+        """Return (document, relevance) pairs, relevance in [0, 1]; missing collection gives []."""
+        if collection_name not in self.list_collections():
+            return []
+        if not query_text or len(query_text.strip()) == 0:
+            logger.warning("Empty query text provided")
+            return []
+
+        try:
+            vs = Chroma(
+                collection_name=collection_name,
+                embedding_function=self.lc_embedding,
+                client=self.client  # Reuse existing client
+            )
+            return vs.similarity_search_with_relevance_scores(query_text, k=k, filter=where)
+        except Exception as e:
+            logger.error(f"Error querying collection '{collection_name}': {str(e)}")
+            return []  # Graceful degradation
+
     # raw ops still available if needed:
     def delete_collection(self, name: str):
         self.client.delete_collection(name=name)
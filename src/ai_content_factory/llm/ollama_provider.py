@@ -1,7 +1,11 @@
 """Ollama LLM provider for local model inference."""
 
+import asyncio
+import json
+import re
+import threading
 import time
-from typing import Optional
+from typing import Iterator, Optional
 
 import requests
 
@@ -11,6 +15,9 @@ from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Last sentence-ending punctuation; used to trim a stream cut off mid-sentence
+_SENTENCE_END = re.compile(r'[.!?]["\')\]]*(?=\s|$)')
+
 
 class OllamaProvider:
     """Provider for Ollama local LLM models."""
@@ -35,6 +42,10 @@ class OllamaProvider:
         self.model = model or self.config.llm.models.primary
         self.temperature = temperature if temperature is not None else self.config.llm.temperature
         self.max_tokens = max_tokens if max_tokens is not None else self.config.llm.max_tokens
+        self.keep_alive = self.config.llm.keep_alive
+        # Caps in-flight async requests across all event loops/threads using
+        # this provider, so fan-outs don't queue past the server's slots
+        self._slots = threading.BoundedSemaphore(max(1, self.config.llm.num_parallel))
 
         # Validate parameters
         if not (0 <= self.temperature <= 1):
@@ -74,13 +85,39 @@ class OllamaProvider:
             logger.error("Make sure Ollama is running. Try: ollama serve")
             raise RuntimeError(f"Ollama connection failed: {str(e)}")
 
+    def warm_up(self) -> None:
+        """Load the model into memory ahead of the first real request.
+
+        Issues a one-token generation so Ollama loads the weights now instead
+        of during the first user request. Failures are logged, not raised.
+        """
+        payload = {
+            "model": self.model,
+            "prompt": " ",
+            "options": {"num_predict": 1},
+            "keep_alive": self.keep_alive,
+            "stream": False
+        }
+
+        try:
+            response = requests.post(
+                f"{self.base_url}/api/generate",
+                json=payload,
+                timeout=self.config.llm.timeout_seconds
+            )
+            response.raise_for_status()
+            logger.info(f"Model '{self.model}' warmed up (keep_alive={self.keep_alive})")
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Model warm-up failed: {str(e)}")
+
     def generate(
         self,
         prompt: str,
         system_prompt: str = "",
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
-        stream: bool = False
+        stream: bool = False,
+        format: Optional[str] = None
     ) -> str:
         """Generate text using Ollama.
 
@@ -90,6 +127,7 @@ class OllamaProvider:
             temperature: Override default temperature
             max_tokens: Override default max tokens
             stream: Whether to stream the response (not implemented yet)
+            format: Set to "json" to constrain the output to valid JSON
 
         Returns:
             Generated text
@@ -106,14 +144,17 @@ class OllamaProvider:
                 "temperature": temp,
                 "num_predict": max_tok,
             },
+            "keep_alive": self.keep_alive,
             "stream": False
         }
+        if format:
+            payload["format"] = format
 
         max_retries = getattr(self.config.llm, 'retries', 3)
 
         for attempt in range(max_retries):
             try:
-                logger.debug(f"Generating (attempt {attempt + 1}/{max_retries}), prompt length: {len(prompt)} chars")
+                logger.debug("Generating (attempt %d/%d), prompt length: %d chars", attempt + 1, max_retries, len(prompt))
 
                 response = requests.post(
                     f"{self.base_url}/api/generate",
@@ -125,7 +166,11 @@ class OllamaProvider:
                 result = response.json()
                 generated_text = result.get("response", "")
 
-                logger.debug(f"Generated {len(generated_text)} chars")
+                # Ollama reports exact token counts from the model's own tokenizer
+                logger.debug(
+                    "Generated %d chars (%s prompt tokens, %s output tokens)",
+                    len(generated_text), result.get("prompt_eval_count"), result.get("eval_count")
+                )
                 return generated_text.strip()
 
             except requests.exceptions.Timeout:
@@ -146,6 +191,186 @@ class OllamaProvider:
                     logger.error(f"Ollama API error after {max_retries} attempts: {str(e)}")
                     raise APIError(f"LLM generation failed: {str(e)}")
 
+    def stream_generate(
+        self,
+        prompt: str,
+        system_prompt: str = "",
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """Yield generated text chunks as Ollama produces them.
+
+        Closing the generator early closes the HTTP connection, which makes
+        Ollama stop generating for this request.
+
+        Args:
+            prompt: The user prompt
+            system_prompt: Optional system prompt for context
+            temperature: Override default temperature
+            max_tokens: Override default max tokens
+
+        Yields:
+            Text chunks in generation order
+        """
+        temp = temperature if temperature is not None else self.temperature
+        max_tok = max_tokens if max_tokens is not None else self.max_tokens
+
+        payload = {
+            "model": self.model,
+            "prompt": prompt,
+            "system": system_prompt,
+            "options": {
+                "temperature": temp,
+                "num_predict": max_tok,
+            },
+            "keep_alive": self.keep_alive,
+            "stream": True
+        }
+
+        max_retries = getattr(self.config.llm, 'retries', 3)
+
+        for attempt in range(max_retries):
+            # Text already handed to the caller cannot be taken back, so only
+            # failures before the first chunk are retried
+            started = False
+            try:
+                with requests.post(
+                    f"{self.base_url}/api/generate",
+                    json=payload,
+                    stream=True,
+                    timeout=self.config.llm.timeout_seconds
+                ) as response:
+                    response.raise_for_status()
+                    for line in response.iter_lines():
+                        if not line:
+                            continue
+                        chunk = json.loads(line)
+                        if "error" in chunk:
+                            logger.error(f"Ollama streaming error: {chunk['error']}")
+                            raise APIError(f"LLM streaming failed: {chunk['error']}")
+                        if chunk.get("response"):
+                            started = True
+                            yield chunk["response"]
+                        if chunk.get("done"):
+                            break
+                return
+
+            except requests.exceptions.RequestException as e:
+                if started or attempt == max_retries - 1:
+                    logger.error(f"Ollama streaming error: {str(e)}")
+                    raise APIError(f"LLM streaming failed: {str(e)}")
+                wait_time = 2 ** attempt  # Exponential backoff: 1s, 2s, 4s
+                logger.warning(f"Streaming request failed: {str(e)}, retrying in {wait_time}s...")
+                time.sleep(wait_time)
+
+    def generate_with_word_limit(
+        self,
+        prompt: str,
+        max_words: int,
+        system_prompt: str = "",
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """Stream a generation and stop once it reaches ``max_words`` words.
+
+        Output past the limit is never generated. If the stream was cut off,
+        the trailing partial sentence is dropped.
+
+        Args:
+            prompt: The user prompt
+            max_words: Stop generating after this many words
+            system_prompt: Optional system prompt for context
+            temperature: Override default temperature
+            max_tokens: Override default max tokens
+
+        Returns:
+            Generated text
+        """
+        chunks = []
+        words = 0
+        in_word = False  # Whether the previous chunk ended inside a word
+        stream = self.stream_generate(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+
+        try:
+            for chunk in stream:
+                chunks.append(chunk)
+                # Count words incrementally; a word split across chunks counts once
+                words += len(chunk.split())
+                if in_word and not chunk[0].isspace():
+                    words -= 1
+                in_word = not chunk[-1].isspace()
+
+                if words >= max_words:
+                    text = "".join(chunks)
+                    ends = list(_SENTENCE_END.finditer(text))
+                    if ends:
+                        text = text[:ends[-1].end()]
+                    logger.debug("Stopped generation at %d words (limit %d)", words, max_words)
+                    return text.strip()
+        finally:
+            stream.close()
+
+        return "".join(chunks).strip()
+
+    async def agenerate(
+        self,
+        prompt: str,
+        system_prompt: str = "",
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        max_words: Optional[int] = None,
+        format: Optional[str] = None
+    ) -> str:
+        """Async variant of :meth:`generate`.
+
+        Runs the blocking request in a worker thread so several generations
+        can be in flight at once, at most ``llm.num_parallel`` per provider
+        (Ollama serves up to OLLAMA_NUM_PARALLEL requests per model).
+
+        Args:
+            prompt: The user prompt
+            system_prompt: Optional system prompt for context
+            temperature: Override default temperature
+            max_tokens: Override default max tokens
+            max_words: If set, stream and stop once this many words arrived
+                (see :meth:`generate_with_word_limit`)
+            format: Set to "json" to constrain the output to valid JSON
+                (not combined with ``max_words``)
+
+        Returns:
+            Generated text
+        """
+        if max_words is not None:
+            return await asyncio.to_thread(
+                self._limited,
+                self.generate_with_word_limit,
+                prompt=prompt,
+                max_words=max_words,
+                system_prompt=system_prompt,
+                temperature=temperature,
+                max_tokens=max_tokens
+            )
+
+        return await asyncio.to_thread(
+            self._limited,
+            self.generate,
+            prompt=prompt,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            format=format
+        )
+
+    def _limited(self, func, **kwargs) -> str:
+        """Run a blocking generation while holding one of the parallel slots."""
+        with self._slots:
+            return func(**kwargs)
+
     def chat(
         self,
         messages: list[dict],
@@ -172,6 +397,7 @@ class OllamaProvider:
                 "temperature": temp,
                 "num_predict": max_tok,
             },
+            "keep_alive": self.keep_alive,
             "stream": False
         }
 
@@ -0,0 +1,66 @@
+"""
+Shared model instances for the AI Content Factory.
+"""
+import base64
+import threading
+from functools import lru_cache
+
+import numpy as np
+
+DEFAULT_SENTENCE_MODEL = "all-MiniLM-L6-v2"
+
+_model_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _load_sentence_model(model_name: str):
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(model_name)
+
+
+def get_sentence_model(model_name: str = DEFAULT_SENTENCE_MODEL):
+    """
+    Return the process-wide SentenceTransformer for ``model_name``.
+
+    The weights are loaded once and shared by every agent and clusterer, so
+    building several agents does not keep duplicate copies in memory. The
+    lock makes sure concurrent first calls load the model only once.
+
+    Args:
+        model_name (str): Sentence-transformers model to load
+
+    Returns:
+        SentenceTransformer: Shared model instance
+    """
+    with _model_lock:
+        return _load_sentence_model(model_name)
+
+
+def encode_embedding(vector) -> str:
+    """
+    Encode an embedding for JSON output as base64 float16 bytes.
+
+    This is the format agents store under ``embedding_b64``: about a quarter
+    of the size of float32 and far smaller than a JSON list of floats.
+
+    Args:
+        vector: 1-D embedding (array-like of floats)
+
+    Returns:
+        str: ASCII base64 string
+    """
+    return base64.b64encode(np.asarray(vector, dtype=np.float16).tobytes()).decode('ascii')
+
+
+def decode_embedding(encoded: str) -> np.ndarray:
+    """
+    Decode an ``embedding_b64`` string back into a float32 vector.
+
+    Args:
+        encoded (str): Value produced by :func:`encode_embedding`
+
+    Returns:
+        np.ndarray: 1-D float32 embedding
+    """
+    return np.frombuffer(base64.b64decode(encoded), dtype=np.float16).astype(np.float32)
@@ -0,0 +1,113 @@
+"""
+Tests for the API's JSON store helpers (no server or LLM needed).
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+
+@pytest.fixture(scope="module")
+def api(tmp_path_factory):
+    """Import the API module from a scratch directory (it creates outputs/ on import)."""
+    cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("api"))
+    try:
+        from ai_content_factory.api import app
+    finally:
+        os.chdir(cwd)
+    return app
+
+
+@pytest.fixture
+def library_file(api, tmp_path, monkeypatch):
+    path = tmp_path / "content_library.json"
+    path.write_text(json.dumps([
+        {"id": "a", "title": "First", "status": "draft"},
+        {"id": "b", "title": "Second", "status": "review"},
+    ]))
+    monkeypatch.setattr(api, "CONTENT_STORAGE_FILE", path)
+    return path
+
+
+def touch(path, content):
+    """Rewrite a file and move its mtime forward so the change is always visible."""
+    stat = path.stat()
+    path.write_text(content)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+# ==================== load_json_cached ====================
+
+def test_load_json_cached_reuses_parse_while_unchanged(api, tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text('{"value": 1}')
+
+    first = api.load_json_cached(path)
+    assert first == {"value": 1}
+    assert api.load_json_cached(path) is first
+
+
+def test_load_json_cached_rereads_after_change(api, tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text('{"value": 1}')
+    api.load_json_cached(path)
+
+    touch(path, '{"value": 2}')
+    assert api.load_json_cached(path) == {"value": 2}
+
+
+def test_load_json_cached_copy_is_private(api, tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text('{"items": [{"id": 1}]}')
+    shared = api.load_json_cached(path)
+
+    private = api.load_json_cached(path, copy=True)
+    private["items"][0]["id"] = 99
+
+    assert private == {"items": [{"id": 99}]}
+    assert shared == {"items": [{"id": 1}]}
+    assert api.load_json_cached(path) == {"items": [{"id": 1}]}
+
+
+def test_load_json_cached_missing_file_raises(api, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        api.load_json_cached(tmp_path / "missing.json")
+
+
+# ==================== content library ====================
+
+def test_load_content_library_mutation_does_not_leak(api, library_file):
+    library = api.load_content_library()
+    library[0]["status"] = "published"
+    library.pop()
+
+    assert api.load_content_library() == [
+        {"id": "a", "title": "First", "status": "draft"},
+        {"id": "b", "title": "Second", "status": "review"},
+    ]
+
+
+def test_save_content_library_invalidates_cache(api, library_file):
+    api.load_content_library()
+    api.save_content_library([{"id": "c", "title": "Third", "status": "draft"}])
+    assert [item["id"] for item in api.load_content_library()] == ["c"]
+
+
+def test_add_remove_and_set_status(api, library_file):
+    api.add_to_content_library({"id": "new", "title": "New", "status": "draft"})
+    assert [item["id"] for item in api.load_content_library()] == ["new", "a", "b"]
+
+    assert api.set_content_status("a", "published")
+    assert not api.set_content_status("missing", "published")
+    assert api.load_content_library()[1]["status"] == "published"
+
+    assert api.remove_from_content_library("b")
+    assert not api.remove_from_content_library("b")
+    assert [item["id"] for item in json.loads(library_file.read_text())] == ["new", "a"]
@@ -0,0 +1,37 @@
+"""
+Tests for configuration models that validate user-editable settings.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+from pydantic import ValidationError
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ai_content_factory.config.config_loader import ContentConfig
+
+CONFIG_YAML = Path(__file__).parent.parent / "src" / "ai_content_factory" / "config" / "config.yaml"
+
+
+@pytest.mark.parametrize("mode", ["pool", "dynamic"])
+def test_cta_mode_accepts_known_modes(mode):
+    assert ContentConfig(cta_mode=mode).cta_mode == mode
+
+
+@pytest.mark.parametrize("mode", ["Pool", "llm", ""])
+def test_cta_mode_rejects_unknown_modes(mode):
+    with pytest.raises(ValidationError):
+        ContentConfig(cta_mode=mode)
+
+
+def test_cta_pool_comes_from_config_yaml():
+    assert ContentConfig().cta_pool == []
+
+    content = ContentConfig(**yaml.safe_load(CONFIG_YAML.read_text(encoding="utf-8"))["content"])
+    assert content.cta_mode == "pool"
+    assert content.cta_pool
+    assert all("{keyword}" in cta for cta in content.cta_pool)
@@ -0,0 +1,306 @@
+"""
+Tests for the content writer's parsing and text helpers (no LLM or ChromaDB needed).
+"""
+
+import json
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ai_content_factory.agents.content_writer_agent import (
+    KEYWORD_RE,
+    ArticleRequest,
+    ContentState,
+    ContentWriterAgent,
+    count_words,
+    fix_heading_hierarchy,
+)
+
+
+def make_state(keyword="skincare", **fields):
+    return ContentState(
+        topic="Skincare basics",
+        target_keyword=keyword,
+        target_word_count=1000,
+        target_audience="general readers",
+        content_type="blog_post",
+        **fields
+    )
+
+
+# ==================== _state_to_article ====================
+
+def line_loop_section(content, title):
+    """Section heading and body as the original per-line parser produced them."""
+    heading_line = ""
+    content_lines = []
+    for line in content.split('\n'):
+        if line.startswith("## "):
+            heading_line = line.replace("## ", "").strip()
+        elif line.strip():
+            content_lines.append(line)
+    return heading_line or title, '\n'.join(content_lines).strip()
+
+
+def parsed_sections(contents):
+    state = make_state(sections=[{"title": "Fallback", "content": c} for c in contents])
+    article = ContentWriterAgent._state_to_article(None, state)
+    return [(section.heading, section.content) for section in article.sections]
+
+
+@pytest.mark.parametrize("content", [
+    "## Why it matters\n\nFirst paragraph.\n\nSecond paragraph.\n",
+    "## Spaced heading  \n  indented line\n \n\t\nlast line  ",
+    "## \nHeading is empty",
+    "## Only a heading",
+    "No heading at all\n\nJust text",
+    "\n## Leading blank line\ntext",
+    "## A\n## B\ntext",
+    "## A\n\n## B\n\ntext",
+    "## Skin ## care\nbody",
+    "## First\ntext\n## Second\nmore text",
+    "## Heading\ntext with ## inside\nmore",
+    "##NoSpace\ntext",
+])
+def test_state_to_article_matches_line_loop(content):
+    assert parsed_sections([content]) == [line_loop_section(content, "Fallback")]
+
+
+def test_state_to_article_matches_line_loop_on_random_sections():
+    rng = random.Random(0)
+    pieces = ["## ", "##", "#", "Heading", "text", " ", "\t", "\n", "\n\n", "\r\n", "é"]
+    contents = []
+    for _ in range(3000):
+        content = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 20)))
+        if rng.random() < 0.5:
+            content = "## " + content
+        contents.append(content)
+    assert parsed_sections(contents) == [line_loop_section(c, "Fallback") for c in contents]
+
+
+# ==================== ArticleRequest ====================
+
+@pytest.mark.parametrize("kwargs", [
+    {"topic": "", "target_keyword": "kw"},
+    {"topic": "   ", "target_keyword": "kw"},
+    {"topic": None, "target_keyword": "kw"},
+    {"topic": 123, "target_keyword": "kw"},
+    {"topic": "Topic", "target_keyword": ""},
+    {"topic": "Topic", "target_keyword": " \n "},
+    {"topic": "Topic", "target_keyword": "kw", "target_word_count": 0},
+    {"topic": "Topic", "target_keyword": "kw", "target_word_count": -5},
+])
+def test_article_request_rejects_invalid_input(kwargs):
+    with pytest.raises(ValueError):
+        ArticleRequest(**kwargs)
+
+
+def test_article_request_sanitizes_input():
+    request = ArticleRequest(
+        topic="  " + "t" * 600 + "  ",
+        target_keyword="  " + "k" * 150,
+        target_word_count=800,
+        target_audience="  " + "a" * 300,
+    )
+    assert request.topic == "t" * 500
+    assert request.target_keyword == "k" * 100
+    assert request.target_audience == "a" * 200
+    assert request.target_word_count == 800
+    assert request.content_type == "blog_post"
+
+
+@pytest.mark.parametrize("audience", ["", None])
+def test_article_request_defaults_empty_audience(audience):
+    request = ArticleRequest(topic="Topic", target_keyword="kw", target_audience=audience)
+    assert request.target_audience == "general readers"
+
+
+def test_article_request_is_frozen_and_hashable():
+    request = ArticleRequest(topic="Topic", target_keyword="kw")
+    with pytest.raises(AttributeError):
+        request.topic = "Other"
+    assert hash(request) == hash(ArticleRequest(topic=" Topic ", target_keyword="kw"))
+
+
+# ==================== SEO meta ====================
+
+class FakeLLM:
+    """Returns queued responses and records the prompts it was called with."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    async def agenerate(self, prompt, system_prompt="", format=None, **kwargs):
+        self.calls.append({"prompt": prompt, "system_prompt": system_prompt, "format": format})
+        return self.responses.pop(0)
+
+
+def make_agent(llm):
+    agent = ContentWriterAgent.__new__(ContentWriterAgent)
+    agent.llm = llm
+    return agent
+
+
+async def test_seo_meta_uses_single_json_call():
+    description = "skincare " + "made simple for every skin type and every budget. " * 3
+    llm = FakeLLM(json.dumps({
+        "meta_description": description,
+        "keywords": ['"routine"', " serum ", "skincare"],
+    }))
+
+    meta_description, keywords = await make_agent(llm)._generate_seo_meta(make_state())
+
+    assert len(llm.calls) == 1
+    assert llm.calls[0]["format"] == "json"
+    assert meta_description == ContentWriterAgent._finalize_meta_description(description, "skincare")
+    assert 120 <= len(meta_description) <= 160
+    assert keywords == ["routine", "serum", "skincare"]
+
+
+async def test_seo_meta_puts_primary_keyword_first():
+    llm = FakeLLM(json.dumps({"meta_description": "Short.", "keywords": ["routine"]}))
+    meta_description, keywords = await make_agent(llm)._generate_seo_meta(make_state())
+    assert keywords == ["skincare", "routine"]
+    assert meta_description.startswith("skincare: Short.")
+
+
+@pytest.mark.parametrize("response", [
+    "not json at all",
+    json.dumps({"meta_description": "only a description"}),
+    json.dumps({"meta_description": 5, "keywords": ["a"]}),
+    json.dumps({"meta_description": "text", "keywords": "a, b"}),
+    json.dumps(["meta", "keywords"]),
+])
+async def test_seo_meta_falls_back_to_plain_prompts(response):
+    llm = FakeLLM(response, "A fine description", '"routine", serum')
+
+    meta_description, keywords = await make_agent(llm)._generate_seo_meta(make_state())
+
+    assert len(llm.calls) == 3
+    assert [call["format"] for call in llm.calls[1:]] == [None, None]
+    assert meta_description == ContentWriterAgent._finalize_meta_description("A fine description", "skincare")
+    assert keywords == ["skincare", "routine", "serum"]
+
+
+def test_finalize_meta_description_clamps_length():
+    long_description = "skincare " + "x" * 300
+    assert ContentWriterAgent._finalize_meta_description(long_description, "skincare").endswith("...")
+    assert len(ContentWriterAgent._finalize_meta_description(long_description, "skincare")) == 160
+
+    kept = "Skincare " + "y" * 130
+    assert ContentWriterAgent._finalize_meta_description(kept, "skincare") == kept
+
+
+# ==================== KEYWORD_RE ====================
+
+def split_keywords(response):
+    """Keywords as the original split/strip parsing produced them."""
+    return [kw.strip().strip('"\'') for kw in response.split(',') if kw.strip()]
+
+
+@pytest.mark.parametrize("response", [
+    "skincare, routine, serum",
+    "  skincare ,routine,  night cream  ",
+    '"skincare", \'routine\', "anti-aging serum"',
+    "skincare,,routine, ,serum",
+    "a, b, c",
+    "single keyword",
+    "",
+])
+def test_keyword_re_matches_split_parsing(response):
+    assert KEYWORD_RE.findall(response) == split_keywords(response)
+
+
+def test_keyword_re_drops_quote_only_entries():
+    # The split parsing kept an empty string for an entry made only of quotes
+    assert split_keywords('"", serum') == ['', 'serum']
+    assert KEYWORD_RE.findall('"", serum') == ['serum']
+
+
+def test_keyword_re_trims_whitespace_inside_quotes():
+    assert split_keywords('" serum "') == [' serum ']
+    assert KEYWORD_RE.findall('" serum "') == ['serum']
+
+
+# ==================== fix_heading_hierarchy ====================
+
+def line_loop_heading_fix(markdown):
+    """Heading levels as the original per-line loop in the SEO node fixed them."""
+    fixed_lines = []
+    last_heading_level = 1
+    for line in markdown.split('\n'):
+        if line.startswith('#'):
+            level = len(line) - len(line.lstrip('#'))
+            if level > last_heading_level + 1:
+                level = last_heading_level + 1
+                line = '#' * level + line.lstrip('#')
+            last_heading_level = level
+        fixed_lines.append(line)
+    return '\n'.join(fixed_lines)
+
+
+@pytest.mark.parametrize("markdown", [
+    "",
+    "no headings at all",
+    "# Title\n\n## Section\n\n### Sub",
+    "# Title\n\n### Skipped\n\n#### Deeper",
+    "# Title\n\n#### Deep\n\n## Back\n\n###### Very deep",
+    "### Starts deep\n\ntext",
+    "#NoSpace\n####Also no space",
+])
+def test_fix_heading_hierarchy_matches_line_loop(markdown):
+    assert fix_heading_hierarchy(markdown) == line_loop_heading_fix(markdown)
+
+
+def test_fix_heading_hierarchy_matches_line_loop_on_random_documents():
+    rng = random.Random(0)
+    for _ in range(3000):
+        lines = []
+        for _ in range(rng.randint(0, 12)):
+            if rng.random() < 0.5:
+                lines.append('#' * rng.randint(1, 6) + rng.choice([" Heading", "Heading", ""]))
+            else:
+                lines.append(rng.choice(["text", "", "  # not a heading", "more text"]))
+        markdown = '\n'.join(lines)
+        assert fix_heading_hierarchy(markdown) == line_loop_heading_fix(markdown), repr(markdown)
+
+
+def test_fix_heading_hierarchy_returns_same_object_when_unchanged():
+    markdown = "# Title\n\n## Section"
+    assert fix_heading_hierarchy(markdown) is markdown
+
+
+# ==================== count_words ====================
+
+@pytest.mark.parametrize("text", [
+    "",
+    "   ",
+    "one",
+    "  leading and trailing  ",
+    "tabs\tand\nnewlines\r\nmixed",
+    "## Heading\n\nA paragraph with punctuation, quotes \"like this\" and dashes \u2014 too.",
+    "Curly \u2018quotes\u2019 and \u201cdoubles\u201d, caf\u00e9, na\u00efve, emoji \U0001f642 ok",
+    "multiple     spaces\n\n\nand blank lines",
+])
+def test_count_words_matches_split(text):
+    assert count_words(text) == len(text.split())
+
+
+def test_count_words_matches_split_on_random_text():
+    rng = random.Random(0)
+    pieces = ["word", "\u00e9", "\u2014", "\U0001f642", " ", "  ", "\n", "\t", "\r\n", ",", "x"]
+    for _ in range(2000):
+        text = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 40)))
+        assert count_words(text) == len(text.split()), repr(text)
+
+
+def test_count_words_nbsp_is_part_of_a_word():
+    # Only ASCII whitespace separates words; str.split also splits on NBSP
+    assert count_words("a\u00a0b") == 1
+    assert len("a\u00a0b".split()) == 2
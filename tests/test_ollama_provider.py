@@ -0,0 +1,173 @@
+"""
+Tests for OllamaProvider streaming, with the HTTP layer replaced by in-memory streams.
+"""
+
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ai_content_factory.llm import ollama_provider
+from ai_content_factory.llm.ollama_provider import OllamaProvider
+from ai_content_factory.utils.exceptions import APIError
+
+
+def make_provider(retries=3):
+    """Provider without the connection check done by __init__."""
+    provider = OllamaProvider.__new__(OllamaProvider)
+    provider.config = SimpleNamespace(llm=SimpleNamespace(retries=retries, timeout_seconds=5))
+    provider.base_url = "http://ollama.test"
+    provider.model = "test-model"
+    provider.temperature = 0.5
+    provider.max_tokens = 100
+    provider.keep_alive = "5m"
+    return provider
+
+
+def with_chunks(provider, chunks):
+    """Make stream_generate yield chunks, recording whether it was closed."""
+    state = {"closed": False, "consumed": 0}
+
+    def stream_generate(**kwargs):
+        try:
+            for chunk in chunks:
+                state["consumed"] += 1
+                yield chunk
+        finally:
+            state["closed"] = True
+
+    provider.stream_generate = stream_generate
+    return state
+
+
+class FakeStreamResponse:
+    """Context-managed streaming response yielding NDJSON lines."""
+
+    def __init__(self, lines):
+        self.lines = lines
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_lines(self):
+        for line in self.lines:
+            if isinstance(line, Exception):
+                raise line
+            yield json.dumps(line).encode()
+
+
+# ==================== generate_with_word_limit ====================
+
+@pytest.mark.parametrize("chunks", [
+    ["Short ", "answer."],
+    ["One", " two", " three"],
+    ["split", "word ", "here"],
+    [],
+])
+def test_word_limit_not_reached_returns_full_text(chunks):
+    provider = make_provider()
+    with_chunks(provider, chunks)
+    assert provider.generate_with_word_limit("prompt", max_words=50) == "".join(chunks).strip()
+
+
+def test_word_limit_counts_words_split_across_chunks():
+    # "compre" + "hensive" is one word, so the limit of 3 is hit on the last chunk
+    provider = make_provider()
+    state = with_chunks(provider, ["A compre", "hensive", " guide.", " Extra words", " never read."])
+    assert provider.generate_with_word_limit("prompt", max_words=3) == "A comprehensive guide."
+    assert state["consumed"] == 3
+    assert state["closed"]
+
+
+def test_word_limit_trims_partial_sentence():
+    provider = make_provider()
+    with_chunks(provider, ["First sentence here. ", "Second one is cut", " off mid", " way"])
+    assert provider.generate_with_word_limit("prompt", max_words=8) == "First sentence here."
+
+
+def test_word_limit_keeps_text_without_sentence_end():
+    provider = make_provider()
+    with_chunks(provider, ["no punctuation at all ", "in this stream"])
+    assert provider.generate_with_word_limit("prompt", max_words=4) == "no punctuation at all"
+
+
+def test_word_limit_keeps_closing_quote_after_sentence_end():
+    provider = make_provider()
+    with_chunks(provider, ['He said "stop." ', "Then more", " words follow"])
+    assert provider.generate_with_word_limit("prompt", max_words=5) == 'He said "stop."'
+
+
+# ==================== stream_generate ====================
+
+def test_stream_retries_failures_before_first_chunk(monkeypatch):
+    attempts = []
+
+    def post(*args, **kwargs):
+        attempts.append(kwargs)
+        if len(attempts) == 1:
+            raise requests.exceptions.ConnectionError("connection dropped")
+        return FakeStreamResponse([{"response": "Hello "}, {"response": "world", "done": True}])
+
+    monkeypatch.setattr(ollama_provider.requests, "post", post)
+    monkeypatch.setattr(ollama_provider.time, "sleep", lambda seconds: None)
+
+    assert list(make_provider().stream_generate("prompt")) == ["Hello ", "world"]
+    assert len(attempts) == 2
+
+
+def test_stream_gives_up_after_configured_retries(monkeypatch):
+    attempts = []
+
+    def post(*args, **kwargs):
+        attempts.append(kwargs)
+        raise requests.exceptions.Timeout("timed out")
+
+    monkeypatch.setattr(ollama_provider.requests, "post", post)
+    monkeypatch.setattr(ollama_provider.time, "sleep", lambda seconds: None)
+
+    with pytest.raises(APIError):
+        list(make_provider(retries=2).stream_generate("prompt"))
+    assert len(attempts) == 2
+
+
+def test_stream_does_not_retry_after_first_chunk(monkeypatch):
+    attempts = []
+
+    def post(*args, **kwargs):
+        attempts.append(kwargs)
+        return FakeStreamResponse([
+            {"response": "partial"},
+            requests.exceptions.ChunkedEncodingError("connection broken"),
+        ])
+
+    monkeypatch.setattr(ollama_provider.requests, "post", post)
+    monkeypatch.setattr(ollama_provider.time, "sleep", lambda seconds: None)
+
+    received = []
+    with pytest.raises(APIError):
+        for chunk in make_provider().stream_generate("prompt"):
+            received.append(chunk)
+    assert received == ["partial"]
+    assert len(attempts) == 1
+
+
+def test_stream_error_chunk_raises(monkeypatch):
+    monkeypatch.setattr(
+        ollama_provider.requests, "post",
+        lambda *args, **kwargs: FakeStreamResponse([{"error": "model 'x' not found"}])
+    )
+
+    with pytest.raises(APIError, match="not found"):
+        list(make_provider().stream_generate("prompt"))
@@ -0,0 +1,170 @@
+"""
+Tests for the research agent's text extraction and key phrase helpers
+(no network, summarizer or sentiment model needed).
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+from lxml import html
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ai_content_factory.agents.research_agent import (
+    LLMTopicAnalyzer,
+    _collapsed_text,
+    _term_frequency_phrases,
+    _top_tfidf_phrases,
+)
+
+
+def make_analyzer():
+    """Analyzer without the transformer pipelines loaded by __init__."""
+    analyzer = LLMTopicAnalyzer.__new__(LLMTopicAnalyzer)
+    analyzer.summarizer = None
+    analyzer.sentiment_analyzer = None
+    return analyzer
+
+
+# ==================== topic briefs ====================
+
+def test_batch_fit_does_not_leak_into_later_calls():
+    analyzer = make_analyzer()
+    topic = {'title': 'Retinol basics', 'summary': 'retinol for anti aging needs sunscreen every morning'}
+    before = analyzer.generate_topic_brief(topic)
+
+    analyzer.generate_topic_briefs([
+        {'title': 'Niacinamide guide', 'summary': 'niacinamide helps oily skin and pores daily'},
+        {'title': 'Hydration', 'summary': 'hyaluronic acid hydrates dry skin in winter months'},
+    ])
+
+    assert analyzer.generate_topic_brief(topic) == before
+    assert not hasattr(analyzer, '_key_phrase_vectorizer')
+
+
+# ==================== _top_tfidf_phrases ====================
+
+CORPUS = [
+    "Niacinamide serum helps oily skin and large pores with daily use.",
+    "Retinol for anti aging needs sunscreen every morning and a slow start.",
+    "Hyaluronic acid hydrates dry skin in winter for glowing skin.",
+    "Sunscreen every morning protects skin from aging and dark spots.",
+    "Oily skin oily skin: gentle cleanser, light moisturizer, niacinamide.",
+]
+
+
+def dense_top_phrases(row, feature_names, max_phrases, min_score):
+    """Key phrases as the original densify-and-sort ranking produced them."""
+    scores = row.toarray()[0]
+    return [
+        {'phrase': phrase, 'score': float(score)}
+        for score, phrase in sorted(zip(scores, feature_names), reverse=True)[:max_phrases]
+        if score > min_score
+    ]
+
+
+@pytest.mark.parametrize("max_phrases", [1, 3, 10, 100])
+@pytest.mark.parametrize("min_score", [0.0, 0.1, 0.3])
+def test_top_tfidf_phrases_matches_dense_sort(max_phrases, min_score):
+    vectorizer = TfidfVectorizer(stop_words='english', ngram_range=(1, 3)).fit(CORPUS)
+    names = vectorizer.get_feature_names_out()
+    for text in CORPUS + ["skin skin skin", "nothing in vocabulary here"]:
+        row = vectorizer.transform([text])
+        assert _top_tfidf_phrases(row, names, max_phrases, min_score) == \
+            dense_top_phrases(row, names, max_phrases, min_score)
+
+
+def test_top_tfidf_phrases_breaks_ties_like_dense_sort():
+    # Every term occurs once in a single document, so all scores tie
+    vectorizer = TfidfVectorizer(ngram_range=(1, 2))
+    row = vectorizer.fit_transform(["zeta alpha mid beta"])
+    names = vectorizer.get_feature_names_out()
+    assert _top_tfidf_phrases(row, names, 4, 0.0) == dense_top_phrases(row, names, 4, 0.0)
+
+
+# ==================== _collapsed_text ====================
+
+def join_then_cut(element, max_chars):
+    """Blog text and word count as extract_blog_content originally built them."""
+    text = ' '.join(' '.join(element.itertext()).split())
+    return text[:max_chars], len(text.split())
+
+
+@pytest.mark.parametrize("markup", [
+    "<div></div>",
+    "<div>   </div>",
+    "<div><p>Hello <b>caf\u00e9</b> world</p>\n\t<p>second   para</p></div>",
+    "<div>a<span>b</span>c <i> d </i></div>",
+])
+@pytest.mark.parametrize("max_chars", [0, 3, 5000])
+def test_collapsed_text_matches_join_then_cut(markup, max_chars):
+    element = html.fragment_fromstring(markup)
+    assert _collapsed_text(element, max_chars) == join_then_cut(element, max_chars)
+
+
+def test_collapsed_text_matches_join_then_cut_on_random_fragments():
+    rng = random.Random(0)
+    pieces = ["<p>", "</p>", "<b>", "</b>", "a", "bb", "  ", "\n\t", "word", "caf\u00e9", " x ", "longerword" * 3]
+    for _ in range(1000):
+        markup = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 300)))
+        element = html.fragment_fromstring("<div>" + markup + "</div>")
+        for max_chars in (0, 7, 50, 5000):
+            assert _collapsed_text(element, max_chars) == join_then_cut(element, max_chars)
+
+
+def test_collapsed_text_counts_words_past_the_cut():
+    element = html.fragment_fromstring("<div>" + "<p>lorem ipsum</p>" * 2000 + "</div>")
+    text, word_count = _collapsed_text(element, max_chars=20)
+    assert text == "lorem ipsum lorem ip"
+    assert word_count == 4000
+
+
+# ==================== key phrases without a corpus fit ====================
+
+def test_term_frequency_phrases_counts_non_stop_words():
+    phrases = _term_frequency_phrases(
+        "The best niacinamide serum for oily skin: niacinamide helps with oily pores.", 3
+    )
+    assert phrases == [
+        {'phrase': 'niacinamide', 'score': 2 / 9},
+        {'phrase': 'oily', 'score': 2 / 9},
+        {'phrase': 'best', 'score': 1 / 9},
+    ]
+
+
+def test_term_frequency_phrases_skips_short_and_stop_words():
+    assert _term_frequency_phrases("it is what it was and they were", 5) == []
+
+
+def lone_text_tfidf_phrases(text):
+    """Key phrases from the original single-document TF-IDF fit."""
+    vectorizer = TfidfVectorizer(
+        max_features=100, stop_words='english', ngram_range=(1, 3), min_df=1, max_df=0.8
+    )
+    return _top_tfidf_phrases(vectorizer.fit_transform([text]), vectorizer.get_feature_names_out(), 10, 0.1)
+
+
+@pytest.mark.parametrize("repeat", [1, 5])
+def test_single_text_gets_frequency_phrases(repeat):
+    # 9 and 45 words: a lone-document max_df=0.8 fit prunes every term at any length
+    text = " ".join(["Gentle cleanser routine for sensitive skin and dry skin"] * repeat)
+    with pytest.raises(ValueError):
+        lone_text_tfidf_phrases(text)
+
+    phrases = make_analyzer().extract_key_phrases(text)
+
+    assert phrases == _term_frequency_phrases(text, 10)
+    assert phrases[0] == {'phrase': 'skin', 'score': 2 / 6}
+    assert {p['phrase'] for p in phrases} == {'skin', 'gentle', 'cleanser', 'routine', 'sensitive'}
+
+
+def test_single_topic_brief_has_key_phrases():
+    summary = " ".join(["Retinol needs sunscreen every morning and a slow start for sensitive skin."] * 4)
+    brief = make_analyzer().generate_topic_brief({'title': 'Retinol basics', 'summary': summary})
+    assert brief['key_phrases'][0]['phrase'] == 'retinol'
+    assert len(brief['key_phrases']) == 5
+    assert brief['analysis_quality'] == 'high'